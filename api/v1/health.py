@@ -47,20 +47,16 @@ async def health_check() -> dict:
         if db is not None:
             await db.close()
 
-    # Check Redis
-    rc = None
+    # Check Redis (through the app-wide client, so its connection pool is reused)
+    rc: RedisClient = request.state.rc
     redis_start = time.time()
     try:
-        rc = RedisClient()
         await rc.ping()
         checks["redis"]["response_time_ms"] = round((time.time() - redis_start) * 1000, 2)
     except Exception as e:
         checks["redis"]["status"] = "error"
         checks["redis"]["message"] = str(e)
         has_error = True
-    finally:
-        if rc is not None:
-            await rc.aclose()
     
     # Check osu! API (optional - only if credentials available)
     try:
@@ -16,6 +16,7 @@ from app.database.enums import RoleName
 from app.database.roles import is_admin
 from app.redis import Namespace, ChannelName, RedisClient
 from app.redis.models import QueueRequestHandlerTask, QueueRequestValidationTask
+from app.utils import stable_hash
 from app.spec import get_include_schema
 from app.database.rules.context import ExecutionContext, parse_osu_beatmapset
 from app.database.rules.engine.phase1_runner import Phase1Runner
@@ -260,11 +261,11 @@ async def delete(request_id: int, **kwargs):
     handler_task_key = Namespace.QUEUE_REQUEST_HANDLER_TASK.hash_name(handler_task_hash)
     logger.debug(
         f"DELETE /requests/{request_id}: cleaning up handler_task_hash={handler_task_hash}, "
-        f"handler_task_key={handler_task_key}, validation_task_hash={hash(('validation', request_.id)) & 0x7FFFFFFFFFFFFFFF}"
+        f"handler_task_key={handler_task_key}, validation_task_hash={stable_hash("validation", request_.id)}"
     )
     await rc.delete(handler_task_key)
 
-    validation_task_hash = hash(("validation", request_.id)) & 0x7FFFFFFFFFFFFFFF
+    validation_task_hash = stable_hash("validation", request_.id)
     validation_task_key = Namespace.QUEUE_REQUEST_HANDLER_TASK.hash_name(validation_task_hash)
     await rc.delete(validation_task_key)
 
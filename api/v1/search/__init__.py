@@ -9,7 +9,7 @@ from connexion.exceptions import Unauthorized
 from api.auth import bearer_info, api_key_info
 from api.pagination import build_pagination_response
 from api.utils import pop_auth_info
-from app.patches.validators import validate_include
+from app.patches.validators import get_include_validator
 from app.database import PostgresqlDB
 from app.database.queue_access import queue_visibility_where
 from app.redis import RedisClient
@@ -103,7 +103,7 @@ async def search(**kwargs):
 
         caller_user_id = await _authenticate_for_scope(sq.scope)
 
-        validate_include(include, get_include_schema(SCOPE_MODEL_MAPPING[sq.scope]))
+        get_include_validator(get_include_schema(SCOPE_MODEL_MAPPING[sq.scope]))(include)
 
         limit = kwargs.get("limit", 50)
         offset = kwargs.get("offset", 0)
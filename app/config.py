@@ -1,12 +1,14 @@
 import os
 from contextlib import contextmanager
 from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterator
 
+import yaml
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic_settings.sources import YamlConfigSettingsSource
+from pydantic_settings.sources import InitSettingsSource
 
 from .enums import Env
 
@@ -18,6 +20,29 @@ _SECURITY_ENABLED_OVERRIDE: ContextVar[bool | None] = ContextVar(
 
 _bootstrap_yaml_file: str = "config/bootstrap.yaml"
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=4)
+def _parse_bootstrap_yaml(path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def _load_bootstrap_yaml(path: str) -> dict[str, Any]:
+    """Return the parsed bootstrap YAML, re-parsing only when the file changes.
+
+    ``CONFIG.bootstrap`` is read several times during startup and shutdown, so the
+    parsed document is cached per path and modification time, using libyaml's C
+    loader when it is available.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    return _parse_bootstrap_yaml(path, mtime_ns)
+
 
 class QueueConfig(BaseSettings):
     model_config = SettingsConfigDict(extra="ignore")
@@ -37,11 +62,7 @@ class UserConfig(BaseSettings):
 
 
 class BootstrapConfig(BaseSettings):
-    model_config = SettingsConfigDict(
-        yaml_file="config/bootstrap.yaml",
-        yaml_file_encoding="utf-8",
-        extra="ignore"
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     master_queue: QueueConfig = QueueConfig()
     extra_queues: list[QueueConfig] = []
@@ -67,7 +88,7 @@ class BootstrapConfig(BaseSettings):
             init_settings,
             env_settings,
             dotenv_settings,
-            YamlConfigSettingsSource(settings_cls, yaml_file=_bootstrap_yaml_file),
+            InitSettingsSource(settings_cls, init_kwargs=_load_bootstrap_yaml(_bootstrap_yaml_file)),
             file_secret_settings,
         )
 
@@ -137,6 +137,13 @@ class ScheduledFetcherService(ScheduledService, ABC):
 
         raise TimeoutError
 
+    async def _on_stopped(self) -> None:
+        """Perform final cleanup and release the osu! API client's connection pool."""
+        try:
+            await super()._on_stopped()
+        finally:
+            await self._oac.close()
+
     async def _on_job_success(self, record_id: int) -> None:
         """Update the record's last fetch"""
         await self._db.update(self.RECORD_MODEL, record_id, last_fetch=aware_utcnow())
@@ -1,9 +1,12 @@
 from typing import Optional
 
 from pydantic.main import BaseModel
+from pydantic.config import ConfigDict
 
 
 class CurrentNominationSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     beatmapset_id: int
     rulesets: Optional[list[str]]
     reset: bool
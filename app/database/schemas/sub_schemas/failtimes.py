@@ -1,8 +1,11 @@
 from typing import Optional
 
 from pydantic.main import BaseModel
+from pydantic.config import ConfigDict
 
 
 class FailtimesSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     exit: Optional[list[int]]
     fail: Optional[list[int]]
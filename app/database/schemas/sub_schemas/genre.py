@@ -1,7 +1,10 @@
 from pydantic.main import BaseModel
+from pydantic.config import ConfigDict
 from app.osu_api.literals import GenreIdLiteral, GenreNameLiteral
 
 
 class GenreSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: GenreIdLiteral
     name: GenreNameLiteral
@@ -1,9 +1,12 @@
 from typing import Optional
 
 from pydantic.main import BaseModel
+from pydantic.config import ConfigDict
 
 
 class GroupSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     colour: Optional[str]
     has_listing: bool
     has_playmodes: bool
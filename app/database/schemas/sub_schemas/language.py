@@ -1,7 +1,10 @@
 from pydantic.main import BaseModel
+from pydantic.config import ConfigDict
 from app.osu_api.literals import LanguageIdLiteral, LanguageNameLiteral
 
 
 class LanguageSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: LanguageIdLiteral
     name: LanguageNameLiteral
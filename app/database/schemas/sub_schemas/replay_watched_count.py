@@ -1,8 +1,11 @@
 from datetime import date
 
 from pydantic.main import BaseModel
+from pydantic.config import ConfigDict
 
 
 class ReplayWatchedCountSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     start_date: date
     count: int
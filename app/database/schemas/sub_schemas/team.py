@@ -1,9 +1,12 @@
 from typing import Optional
 
 from pydantic.main import BaseModel
+from pydantic.config import ConfigDict
 
 
 class TeamSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     flag_url: Optional[str]
     id: int
     name: str
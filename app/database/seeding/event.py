@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .target import SeederTarget
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SeedEvent:
     """Progress event emitted during seeding.
 
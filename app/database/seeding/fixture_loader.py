@@ -19,6 +19,7 @@ load_seeding_data(targets)
 """
 from __future__ import annotations
 
+import sys
 import json
 from datetime import datetime
 from pathlib import Path
@@ -91,6 +92,25 @@ def check_fixtures(targets: set[SeederTarget]) -> dict:
 # ---------------------------------------------------------------------------
 
 
+def _intern_keys(obj):
+    """Recursively intern every dict key in parsed fixture data.
+
+    Fixture entries end up unpacked as ``db.add(Model, **entry)``, so interned
+    keys let the keyword/attribute lookups downstream match on identity.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_keys(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_keys(item) for item in obj]
+    return obj
+
+
+def _read_json(path: Path):
+    """Parse a fixture file and intern its keys."""
+    with open(path) as fh:
+        return _intern_keys(json.load(fh))
+
+
 def load_seeding_data(targets: set[SeederTarget]) -> dict[SeederTarget, list[dict]]:
     """Load fixture data from instance/fixtures/ and adapt it for seeders.
 
@@ -132,8 +152,7 @@ def _load_users() -> list[dict]:
         if not ruleset_dir.is_dir():
             continue
         for f in sorted(ruleset_dir.glob("user_*.json")):
-            with open(f) as fh:
-                api_data = json.load(fh)
+            api_data = _read_json(f)
 
             user_id = api_data.get("id")
             if user_id is None:
@@ -168,8 +187,7 @@ def _load_beatmaps() -> list[dict]:
 
     beatmapsets: list[dict] = []
     for f in sorted(bms_path.glob("beatmapset_*.json")):
-        with open(f) as fh:
-            api_data = json.load(fh)
+        api_data = _read_json(f)
 
         # The osu! API returns "maps" but the seeder expects "beatmaps"
         if "maps" in api_data and "beatmaps" not in api_data:
@@ -191,8 +209,7 @@ def _load_queues() -> list[dict]:
 
     queues: list[dict] = []
     for f in sorted(queues_path.glob("queue_*.json")):
-        with open(f) as fh:
-            queue_data = json.load(fh)
+        queue_data = _read_json(f)
 
         # Convert ISO string timestamps back to datetime objects
         for col in ("created_at", "updated_at"):
@@ -215,8 +232,7 @@ def _load_requests() -> list[dict]:
 
     requests: list[dict] = []
     for f in sorted(requests_path.glob("request_*.json")):
-        with open(f) as fh:
-            request_data = json.load(fh)
+        request_data = _read_json(f)
 
         # Convert ISO string timestamps back to datetime objects
         for col in ("created_at", "updated_at"):
@@ -2,6 +2,7 @@ import os
 import json
 import asyncio
 import hashlib
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -32,6 +33,22 @@ from .base import Seeder
 BEATMAP_TAGS_PATH = Path("instance/fixtures/beatmap_tags.json")
 
 
+@lru_cache(maxsize=1)
+def _load_beatmap_tags() -> list[dict]:
+    """Read and normalize ``beatmap_tags.json`` once per process.
+
+    The tag fixture is static for the lifetime of the process, so every
+    ``BeatmapSeeder`` instance can share the parsed result.
+
+    Returns:
+        list[dict]: Beatmap tag entries with datetimes normalized.
+    """
+    with open(BEATMAP_TAGS_PATH) as f:
+        tag_data = json.load(f)
+
+    return Seeder._normalize_datetimes(tag_data)
+
+
 class BeatmapSeeder(Seeder):
     def __init__(self, db: PostgresqlDB):
         super().__init__(db)
@@ -61,9 +78,7 @@ class BeatmapSeeder(Seeder):
         if self._beatmap_tags:
             tag_data = self._beatmap_tags
         elif BEATMAP_TAGS_PATH.exists():
-            with open(BEATMAP_TAGS_PATH) as f:
-                tag_data = json.load(f)
-            tag_data = Seeder._normalize_datetimes(tag_data)
+            tag_data = _load_beatmap_tags()
         else:
             return
 
@@ -84,7 +99,7 @@ class BeatmapSeeder(Seeder):
             await self.db.add(Beatmapset, id=beatmapset_id, user_id=user_id, session=self.session)
 
         # 3. Seed beatmaps and collect their snapshots
-        bms_bm_mapping: dict[int, list[dict]] = {}
+        beatmap_snapshot_dicts: list[dict] = []
         beatmaps = beatmapset_entry.get("beatmaps", [])
 
         if not beatmaps:
@@ -94,12 +109,11 @@ class BeatmapSeeder(Seeder):
         self._new_beatmap_ids = []
 
         for beatmap_entry in beatmaps:
-            added_bm_dict = await self._seed_beatmap(beatmap_entry)
-            bms_bm_mapping.setdefault(beatmapset_id, []).extend(added_bm_dict)
+            beatmap_snapshot_dicts.extend(await self._seed_beatmap(beatmap_entry))
 
         # 4. Generate BeatmapsetSnapshot using schema validation
-        if bms_bm_mapping.get(beatmapset_id):
-            await self._generate_bms_snapshot(beatmapset_entry, bms_bm_mapping)
+        if beatmap_snapshot_dicts:
+            await self._generate_bms_snapshot(beatmapset_entry, beatmap_snapshot_dicts)
 
         # 5. Download `.osu` files for newly seeded beatmaps (mirrors BeatmapManager._download,
         # otherwise instance/beatmaps/ never gets created and no seeded beatmap has its file)
@@ -143,7 +157,7 @@ class BeatmapSeeder(Seeder):
             }
             await self.db.add(Profile, **profile_dict, session=self.session)
 
-    async def _generate_bms_snapshot(self, beatmapset_entry: dict, bms_bm_mapping: dict[int, list[dict]]):
+    async def _generate_bms_snapshot(self, beatmapset_entry: dict, beatmap_snapshot_dicts: list[dict]):
         """Generate BeatmapsetSnapshot using schema validation (following BeatmapManager)."""
         beatmapset_id = beatmapset_entry["id"]
         
@@ -173,7 +187,7 @@ class BeatmapSeeder(Seeder):
             snapshot_dict = self._build_snapshot_fallback(beatmapset_entry)
         
         # Add relationships
-        snapshot_dict["beatmap_snapshots"] = bms_bm_mapping.get(beatmapset_id, [])
+        snapshot_dict["beatmap_snapshots"] = beatmap_snapshot_dicts
         snapshot_dict["snapshot_number"] = 1
         
         # Insert snapshot if it doesn't exist
@@ -289,9 +303,9 @@ class BeatmapSeeder(Seeder):
         except Exception as e:
             self.logger.warning(f"Failed to download .osu file(s) for beatmap(s) {beatmap_ids}: {e}")
 
-    async def _seed_beatmapset_snapshot(self, beatmapset_snapshot_entry: dict, bm_bms_mapping: dict[int, list[dict]]):
+    async def _seed_beatmapset_snapshot(self, beatmapset_snapshot_entry: dict, beatmap_snapshot_dicts: list[dict]):
         """Seed an existing beatmapset snapshot from fixture data."""
-        beatmapset_snapshot_entry["beatmap_snapshots"] = bm_bms_mapping[beatmapset_snapshot_entry["beatmapset_id"]]
+        beatmapset_snapshot_entry["beatmap_snapshots"] = beatmap_snapshot_dicts
         
         if not await self.db.get(BeatmapsetSnapshot, checksum=beatmapset_snapshot_entry["checksum"], session=self.session):
             await self.db.add(BeatmapsetSnapshot, **beatmapset_snapshot_entry, session=self.session)
@@ -1,7 +1,9 @@
 import asyncio
 
+from sqlalchemy.sql import select, func
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
+from app.database import PostgresqlDB
 from app.database.models import Request, BeatmapsetSnapshot
 from app.database.crud import session_manager, db_session_resolver
 from app.database.seeding import SeederTarget
@@ -10,16 +12,32 @@ from .base import Seeder
 
 
 class RequestSeeder(Seeder):
+    def __init__(self, db: PostgresqlDB):
+        super().__init__(db)
+        self._latest_snapshot_ids: dict[int, int] = {}
+
     @session_manager(session_resolver=db_session_resolver, autoflush_allowed=False)
     async def seed(self, queue: asyncio.Queue[SeedEvent | None], session: AsyncSession = None):
         self.session = session
         await queue.put(SeedEvent(SeederTarget.REQUEST, self.progress, self.total))
 
+        self._latest_snapshot_ids = await self._get_latest_snapshot_ids()
+
         for request_entry in self.data:
             await self._seed_request(request_entry)
             self.progress += 1
             await queue.put(SeedEvent(SeederTarget.REQUEST, self.progress, self.total))
 
+    async def _get_latest_snapshot_ids(self) -> dict[int, int]:
+        """Map each beatmapset ID to its latest ``BeatmapsetSnapshot`` ID in one query."""
+        stmt = (
+            select(BeatmapsetSnapshot.beatmapset_id, func.max(BeatmapsetSnapshot.id))
+            .group_by(BeatmapsetSnapshot.beatmapset_id)
+        )
+        result = await self.session.execute(stmt)
+
+        return dict(result.tuples().all())
+
     async def _seed_request(self, request_entry: dict):
         beatmapset_id = request_entry["beatmapset_id"]
 
@@ -29,17 +47,12 @@ class RequestSeeder(Seeder):
             queue_id=request_entry["queue_id"],
             session=self.session
         ):
-            beatmapset_snapshot = await self.db.get(
-                BeatmapsetSnapshot,
-                beatmapset_id=beatmapset_id,
-                _sorting=[{"field": "BeatmapsetSnapshot.id", "order": "desc"}],
-                session=self.session
-            )
-            if beatmapset_snapshot is None:
+            beatmapset_snapshot_id = self._latest_snapshot_ids.get(beatmapset_id)
+            if beatmapset_snapshot_id is None:
                 self.logger.warning(
                     f"Skipping request {request_entry['id']}: "
                     f"no BeatmapsetSnapshot for beatmapset {beatmapset_id}"
                 )
                 return
-            request_entry["beatmapset_snapshot_id"] = beatmapset_snapshot.id
+            request_entry["beatmapset_snapshot_id"] = beatmapset_snapshot_id
             await self.db.add(Request, **request_entry, session=self.session)
@@ -26,7 +26,7 @@ class SeederTarget(StrEnum):
     @property
     def seed_title(self) -> str:
         """Return the CLI-friendly display name for the target."""
-        return SEEDER_TO_CLI[self].capitalize()
+        return SEED_TITLES[self]
 
 
 CLI_TO_SEEDER: dict[SeedTarget, SeederTarget] = {
@@ -39,3 +39,6 @@ CLI_TO_SEEDER: dict[SeedTarget, SeederTarget] = {
 
 SEEDER_TO_CLI: dict[SeederTarget, SeedTarget] = {v: k for k, v in CLI_TO_SEEDER.items()}
 """Reverse mapping from internal ``SeederTarget`` to CLI ``SeedTarget``."""
+
+SEED_TITLES: dict[SeederTarget, str] = {k: v.capitalize() for k, v in SEEDER_TO_CLI.items()}
+"""Precomputed display names for each ``SeederTarget``."""
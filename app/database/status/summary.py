@@ -13,10 +13,11 @@ from app.database.models import (
 
 async def get_summary_status(session: AsyncSession) -> dict:
     models = (User, Beatmap, Beatmapset, Queue, Request)
-    status = {"target": "summary"}
+    stmt = select(*(
+        select(func.count()).select_from(model).scalar_subquery().label(model.__tablename__)
+        for model in models
+    ))
 
-    for model in models:
-        count = await session.scalar(select(func.count()).select_from(model))
-        status[model.__tablename__] = count
+    row = (await session.execute(stmt)).one()
 
-    return status
+    return {"target": "summary", **row._mapping}
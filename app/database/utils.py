@@ -1,5 +1,5 @@
-from typing import Any, Union, get_origin, get_args, Iterable
-from typing import cast as typing_cast
+from functools import lru_cache
+from typing import Any, Callable, Union, get_origin, get_args
 
 from sqlalchemy.sql import any_, all_, cast
 from sqlalchemy.sql.elements import ColumnClause, literal, BinaryExpression, BindParameter, CollectionAggregate, ColumnElement
@@ -7,7 +7,7 @@ from sqlalchemy.sql.functions import func
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.dialects.postgresql import ARRAY
 
-from app.exceptions import TypeValidationError
+from app.exceptions import TypeValidationError, TupleLengthValidationError
 from app.database.enums import FilterOperator
 
 __all__ = [
@@ -21,7 +21,8 @@ def extract_inner_types(annotated_type: Any) -> type | tuple[type, ...]:
     """Extract concrete inner types from nested typing annotations.
 
     Unwraps Optional, Union, and generic containers to determine the underlying runtime
-    type(s).
+    type(s). Results are memoized per annotation; unhashable annotations fall back to
+    the uncached computation.
 
     Args:
         annotated_type:
@@ -30,6 +31,13 @@ def extract_inner_types(annotated_type: Any) -> type | tuple[type, ...]:
     Returns:
         A single type or tuple of possible types.
     """
+    try:
+        return _extract_inner_types_cached(annotated_type)
+    except TypeError:
+        return _extract_inner_types(annotated_type)
+
+
+def _extract_inner_types(annotated_type: Any) -> type | tuple[type, ...]:
     current = annotated_type
 
     while get_origin(current):
@@ -50,6 +58,9 @@ def extract_inner_types(annotated_type: Any) -> type | tuple[type, ...]:
     return current
 
 
+_extract_inner_types_cached = lru_cache(maxsize=1024)(_extract_inner_types)
+
+
 def validate_type(expected_type: Any, value: Any):
     """Recursively validate a value against a typing annotation.
 
@@ -59,6 +70,10 @@ def validate_type(expected_type: Any, value: Any):
         - dict
         - Numeric widening (int accepted for float)
 
+    The annotation is compiled into a validator closure on first sight (see
+    ``_compile_validator``), so repeated validations against the same annotation
+    skip the ``get_origin``/``get_args`` introspection entirely.
+
     Args:
         expected_type:
             Typing annotation to validate against.
@@ -69,52 +84,122 @@ def validate_type(expected_type: Any, value: Any):
         TypeValidationError:
             If validation fails at any level.
     """
+    _compile_validator(expected_type)(value)
+
+
+@lru_cache(maxsize=512)
+def _compile_validator(expected_type: Any) -> Callable[[Any], None]:
+    """Build a specialized validator closure for a typing annotation.
+
+    Origin and argument resolution happens once per annotation; nested annotations
+    are compiled recursively so the returned closure never re-inspects the type.
+
+    Args:
+        expected_type:
+            Typing annotation to compile.
+
+    Returns:
+        A callable raising ``TypeValidationError`` if its argument does not match.
+    """
     origin = get_origin(expected_type)
     args = get_args(expected_type)
 
     if origin is Union:
-        for arg in args:
-            try:
-                validate_type(arg, value)
-                return
-            except TypeValidationError:
-                continue
+        arg_validators = tuple(_compile_validator(arg) for arg in args)
+
+        def validate_union(value: Any):
+            for arg_validator in arg_validators:
+                try:
+                    arg_validator(value)
+                    return
+                except TypeValidationError:
+                    continue
+
+            raise TypeValidationError(type(value), *args)
 
-        raise TypeValidationError(type(value), *args)
+        return validate_union
 
     if origin in (list, tuple):
-        if not isinstance(value, origin):
-            raise TypeValidationError(type(value), origin)
+        if origin is list or len(args) == 1 or (len(args) == 2 and args[1] is Ellipsis):
+            item_validator = _compile_validator(args[0])
 
-        iterable_value = typing_cast(Iterable[Any], value)
-        item_types = args if origin is tuple and len(args) > 1 else [args[0]]
+            def validate_homogeneous_sequence(value: Any):
+                if type(value) is not origin and not isinstance(value, origin):
+                    raise TypeValidationError(type(value), origin)
 
-        for i, item in enumerate(iterable_value):
-            expected_item_type = item_types[min(i, len(item_types) - 1)]
-            validate_type(expected_item_type, item)
+                for item in value:
+                    item_validator(item)
 
-        return
+            return validate_homogeneous_sequence
 
-    if origin is dict:
-        if not isinstance(value, dict):
-            raise TypeValidationError(type(value), dict)
+        item_validators = tuple(_compile_validator(item_type) for item_type in args)
+
+        def validate_positional_tuple(value: Any):
+            if type(value) is not tuple and not isinstance(value, tuple):
+                raise TypeValidationError(type(value), tuple)
+
+            if len(value) != len(item_validators):
+                raise TupleLengthValidationError(len(item_validators), len(value))
+
+            for item_validator, item in zip(item_validators, value):
+                item_validator(item)
+
+        return validate_positional_tuple
 
+    if origin is dict:
         key_type, val_type = args
+        key_validator = _compile_validator(key_type)
+        val_validator = _compile_validator(val_type)
+
+        def validate_dict(value: Any):
+            if type(value) is not dict and not isinstance(value, dict):
+                raise TypeValidationError(type(value), dict)
 
-        for k, v in value.items():
-            validate_type(key_type, k)
-            validate_type(val_type, v)
+            for k, v in value.items():
+                key_validator(k)
+                val_validator(v)
 
-        return
+        return validate_dict
 
     if expected_type is float:
-        if not isinstance(value, (float, int)):
-            raise TypeValidationError(type(value), float, int)
+        def validate_float(value: Any):
+            value_type = type(value)
+
+            if value_type is float or value_type is int:
+                return
 
-        return
+            if not isinstance(value, (float, int)):
+                raise TypeValidationError(type(value), float, int)
 
-    if not isinstance(value, expected_type):
-        raise TypeValidationError(type(value), expected_type)
+        return validate_float
+
+    def validate_instance(value: Any):
+        if type(value) is expected_type:
+            return
+
+        if not isinstance(value, expected_type):
+            raise TypeValidationError(type(value), expected_type)
+
+    return validate_instance
+
+
+_AGGREGATED_CONDITIONS: dict[FilterOperator, Callable[[Any, Any], ColumnElement[bool]]] = {
+    FilterOperator.EQ: lambda target, value: literal(value) == any_(func.array_agg(target)),
+    FilterOperator.NEQ: lambda target, value: literal(value) != all_(func.array_agg(target)),
+    FilterOperator.GT: lambda target, value: any_(func.array_agg(target)) > literal(value),
+    FilterOperator.LT: lambda target, value: any_(func.array_agg(target)) < literal(value),
+    FilterOperator.GTE: lambda target, value: any_(func.array_agg(target)) >= literal(value),
+    FilterOperator.LTE: lambda target, value: any_(func.array_agg(target)) <= literal(value),
+    FilterOperator.IN: lambda target, value: func.array_agg(target).op("&&")(cast(literal(value), ARRAY(target.type))),
+    FilterOperator.NOT_IN: lambda target, value: ~func.array_agg(target).op("&&")(cast(literal(value), ARRAY(target.type))),
+    FilterOperator.IS_NULL: lambda target, value: func.bool_and(target.is_(None)),
+    FilterOperator.REGEX: lambda target, value: func.bool_or(target.op("~")(literal(value))),
+    FilterOperator.NOT_REGEX: lambda target, value: func.bool_and(~target.op("~")(literal(value))),
+}
+"""Aggregated (HAVING) condition builders keyed by ``FilterOperator``.
+
+Each builder only constructs the ``array_agg`` expression if its comparison uses it.
+"""
 
 
 def get_filter_condition(
@@ -152,30 +237,9 @@ def get_filter_condition(
             raise ValueError(f"Invalid filter operator: {filter_operator}")
         return filter_operator.method(target, value)
 
-    array_agg = func.array_agg(target)
-
-    match filter_operator:
-        case FilterOperator.EQ:
-            return literal(value) == any_(array_agg)
-        case FilterOperator.NEQ:
-            return literal(value) != all_(array_agg)
-        case FilterOperator.GT:
-            return any_(array_agg) > literal(value)
-        case FilterOperator.LT:
-            return any_(array_agg) < literal(value)
-        case FilterOperator.GTE:
-            return any_(array_agg) >= literal(value)
-        case FilterOperator.LTE:
-            return any_(array_agg) <= literal(value)
-        case FilterOperator.IN:
-            return array_agg.op("&&")(cast(literal(value), ARRAY(target.type)))
-        case FilterOperator.NOT_IN:
-            return ~array_agg.op("&&")(cast(literal(value), ARRAY(target.type)))
-        case FilterOperator.IS_NULL:
-            return func.bool_and(target.is_(None))
-        case FilterOperator.REGEX:
-            return func.bool_or(target.op("~")(literal(value)))
-        case FilterOperator.NOT_REGEX:
-            return func.bool_and(~target.op("~")(literal(value)))
-        case _:
-            raise ValueError(f"Invalid filter operator: {filter_operator}")
+    try:
+        build_condition = _AGGREGATED_CONDITIONS[filter_operator]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid filter operator: {filter_operator}") from None
+
+    return build_condition(target, value)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Sequence, TYPE_CHECKING
 
 from app.utils import aware_utcnow
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "TypeValidationError",
+    "TupleLengthValidationError",
     "FieldValidationError",
     "FieldNotSupportedError",
     "FieldConditionValidationError",
@@ -41,15 +43,27 @@ class TypeValidationError(TypeError):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"Expected type(s) {self.expected_types}, but got {self.value_type.__name__}"
 
-    @property
+    @cached_property
     def expected_types(self) -> str:
         return ", ".join(t.__name__ for t in self.target_types)
 
 
+class TupleLengthValidationError(TypeValidationError):
+    def __init__(self, expected_length: int, actual_length: int):
+        self.expected_length = expected_length
+        self.actual_length = actual_length
+
+        super().__init__(tuple, tuple)
+
+    @cached_property
+    def message(self) -> str:
+        return f"Expected tuple of length {self.expected_length}, but got length {self.actual_length}"
+
+
 class FieldValidationError(TypeValidationError):
     def __init__(
         self,
@@ -67,7 +81,7 @@ class FieldValidationError(TypeValidationError):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return (
             f"Field '{self.field}' of model '{self.model.__name__}' received value {repr(self.value)} "
@@ -83,7 +97,7 @@ class FieldNotSupportedError(Exception):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"Model '{self.model.__name__}' does not support field '{self.field}'"
 
@@ -97,7 +111,7 @@ class FieldConditionValidationError(Exception):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"Invalid conditions for field '{self.field}' of model '{self.model.__name__}': {self.detail}"
 
@@ -109,7 +123,7 @@ class UnknownFieldCategoryError(Exception):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"Unknown field category '{self.category}'"
 
@@ -121,7 +135,7 @@ class AllValuesNullError(Exception):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"All {self.origin} values cannot be None"
 
@@ -133,7 +147,7 @@ class RestrictedUserError(ValueError):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"User {self.user_id} is either restricted, deleted, or otherwise inaccessible"
 
@@ -170,7 +184,7 @@ class RedisLockTimeoutError(TimeoutError):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"Could not acquire lock for '{self.key}' after {self.timeout} seconds"
 
@@ -184,13 +198,13 @@ class ArrayValidationError(ValueError):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"At index {self.index}: {self._message}"
 
 
 class DeepObjectValidationError(ValueError):
-    def __init__(self, path: Sequence[str], message: str):
+    def __init__(self, path: tuple[str, ...], message: str):
         self.path = path
         self._message = message
         super().__init__(self.message)
@@ -198,7 +212,7 @@ class DeepObjectValidationError(ValueError):
     def __str__(self):
         return self.message
 
-    @property
+    @cached_property
     def message(self) -> str:
         return f"{'.'.join(self.path)}: {self._message}"
 
@@ -4,23 +4,6 @@ import sys
 import traceback
 
 from app.logging import setup_logging
-from rich.console import Console
-from .status import cmd_status
-from .reset import cmd_reset
-from .seed import cmd_seed
-from .api_keys import cmd_generate_api_key
-from .fixtures import (
-    cmd_clean_fixtures,
-    cmd_demote_fixtures,
-    cmd_fetch_fixtures,
-    cmd_fetch_users_from_beatmapsets,
-    cmd_fixture_status,
-    cmd_generate,
-    cmd_promote_fixtures,
-    cmd_reconcile,
-    cmd_refresh_archives,
-    cmd_refresh_top_players,
-)
 
 def build_status_parser(subparsers):
     p = subparsers.add_parser("status", help="View database status")
@@ -303,17 +286,27 @@ async def main():
 
     try:
         match args.command:
+            # Command modules are imported per branch so a single command doesn't pay
+            # for importing every other command's dependencies at startup
             case "status":
+                from .status import cmd_status
+
                 await cmd_status(args.target)
             case "reset":
+                from .reset import cmd_reset
+
                 await cmd_reset(args.seed_target, force=getattr(args, "force", False))
             case "seed":
+                from .seed import cmd_seed
+
                 await cmd_seed(
                     args.target,
                     ensure_fixtures=getattr(args, "ensure_fixtures", False),
                     profile_name=getattr(args, "profile", "default"),
                 )
             case "generate-api-key":
+                from .api_keys import cmd_generate_api_key
+
                 await cmd_generate_api_key(
                     user_id=args.user_id,
                     expires_days=args.expires_days,
@@ -340,6 +333,19 @@ async def main():
                         stamp(args.revision, purge=args.purge)
                         print(f"Stamped to {args.revision}")
             case "fixtures":
+                from .fixtures import (
+                    cmd_clean_fixtures,
+                    cmd_demote_fixtures,
+                    cmd_fetch_fixtures,
+                    cmd_fetch_users_from_beatmapsets,
+                    cmd_fixture_status,
+                    cmd_generate,
+                    cmd_promote_fixtures,
+                    cmd_reconcile,
+                    cmd_refresh_archives,
+                    cmd_refresh_top_players,
+                )
+
                 fixture_cmd = args.fixture_command
                 match fixture_cmd:
                     case "fetch":
@@ -23,12 +23,12 @@ async def cmd_reset(
     steps = 2 if not seed_target else 3
 
     await db.recreate_database()
-    logger.info(f"(1/{steps}) Database cleared")
+    logger.info("(1/%s) Database cleared", steps)
 
     runner = SetupRunner(CONFIG.bootstrap, db=db)
     await runner.run(steps=["seed_roles", "seed_users", "seed_api_keys", "seed_queues"])
-    logger.info(f"(2/{steps}) Database set-up")
+    logger.info("(2/%s) Database set-up", steps)
 
     if seed_target:
         await cmd_seed(db, seed_target)
-        logger.info(f"(3/{steps}) Database seeded")
+        logger.info("(3/%s) Database seeded", steps)
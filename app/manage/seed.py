@@ -1,4 +1,5 @@
 import sys
+import time
 
 from rich.panel import Panel
 from rich.live import Live
@@ -26,6 +27,8 @@ from app.database.seeding.fixture_loader import load_seeding_data
 from app.fixtures.queue_request_generator import QueueRequestFixtureGenerator
 from app.logging import get_logger
 
+PROGRESS_REFRESH_PER_SECOND = 20
+
 
 @db_lifespan
 async def cmd_seed(
@@ -58,7 +61,7 @@ async def cmd_seed(
     # Auto-fetch/generate missing fixtures if requested
     if ensure_fixtures:
         profile = get_profile(profile_name)
-        logger.info(f"Using profile: {profile}")
+        logger.info("Using profile: %s", profile)
 
         from app.manage.seed_helpers import ensure_fixtures_async
 
@@ -89,7 +92,9 @@ async def cmd_seed(
 
         if needs_generation:
             logger.info(
-                f"Generating queue and request fixtures ({queue_count} queues, {request_count} requests)..."
+                "Generating queue and request fixtures (%s queues, %s requests)...",
+                queue_count,
+                request_count,
             )
 
             # Clean up existing queue/request fixtures to avoid stale/corrupted data
@@ -108,7 +113,7 @@ async def cmd_seed(
             requests = generator.generate_requests(queues=queues, count=request_count)
             generator.save_queues(queues)
             generator.save_requests(requests)
-            logger.info(f"Generated {len(queues)} queues and {len(requests)} requests")
+            logger.info("Generated %s queues and %s requests", len(queues), len(requests))
 
     # Load and adapt fixture data
     seeding_data = load_seeding_data(internal_targets)
@@ -127,7 +132,7 @@ async def cmd_seed(
         f"({', '.join(SEEDER_TO_CLI[seeder] for seeder in layer)})"
         for layer in orchestrator.execution_order
     )
-    logger.info(f"Seed execution order: {execution_order_string}")
+    logger.info("Seed execution order: %s", execution_order_string)
 
     # Inject loaded data into seeders
     for seed_target, seeder in orchestrator.seeders.items():
@@ -161,7 +166,21 @@ async def cmd_seed(
     panel = Panel.fit(progress, title="Seeding the Database", border_style="green", padding=(1, 3))
     progress_table.add_row(panel)
 
-    with Live(progress_table, refresh_per_second=20):
+    # Events arrive once per seeded row, but the display only refreshes
+    # PROGRESS_REFRESH_PER_SECOND times a second, so the latest count per task is
+    # held back and applied at most once per refresh interval.
+    pending_progress: dict[TaskID, int] = {}
+    flush_interval = 1 / PROGRESS_REFRESH_PER_SECOND
+    last_flush = time.monotonic()
+
+    def flush_progress():
+        for task_id, completed in pending_progress.items():
+            progress.update(task_id, completed=completed)
+
+        pending_progress.clear()
+        progress.update(overall_task, completed=overall_progress)
+
+    with Live(progress_table, refresh_per_second=PROGRESS_REFRESH_PER_SECOND):
         async for event in orchestrator.run_seeders():
             task = seeder_tasks[event.target]
 
@@ -170,8 +189,13 @@ async def cmd_seed(
                 continue
 
             overall_progress += 1
-            progress.update(task, completed=event.current)
-            progress.update(overall_task, completed=overall_progress)
+            pending_progress[task] = event.current
+
+            if (now := time.monotonic()) - last_flush >= flush_interval:
+                flush_progress()
+                last_flush = now
+
+        flush_progress()
 
         panel.title = "Seeding Completed"
         panel.border_style = "dim green"
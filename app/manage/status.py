@@ -23,22 +23,28 @@ def _format_value(v, width: int, prefix: str = "") -> str:
 def print_status(status: dict):
     target = status.pop("target").upper()
     row_width = 30
+    separator = "=" * row_width
 
-    print("=" * row_width)
-    print(align_center(f"STATUS {target}", row_width))
-    print("=" * row_width)
+    lines = [
+        separator,
+        align_center(f"STATUS {target}", row_width),
+        separator,
+    ]
 
     for k, v in status.items():
         if isinstance(v, dict):
-            print(justify(k, f"[dict with {len(v)} items]", width=row_width))
+            lines.append(justify(k, f"[dict with {len(v)} items]", width=row_width))
             for sub_k, sub_v in v.items():
                 sub_line = f"  {sub_k}: {_format_value(sub_v, row_width, prefix='')}"
                 if len(sub_line) > row_width:
                     sub_line = sub_line[: row_width - 1] + "…"
-                print(sub_line)
+                lines.append(sub_line)
         elif isinstance(v, Iterable) and not isinstance(v, (str, bytes)):
-            print(justify(k, f"[{len(v)} items]", width=row_width))
+            lines.append(justify(k, f"[{len(v)} items]", width=row_width))
         else:
-            print(justify(k, str(v), width=row_width))
+            lines.append(justify(k, str(v), width=row_width))
 
-    print("=" * row_width)
+    lines.append(separator)
+
+    # One write for the whole block so it can't interleave with other output
+    print("\n".join(lines))
@@ -1,8 +1,13 @@
 import logging
 import logging.handlers
+import os
 import sys
+import threading
+from functools import lru_cache
 from inspect import FrameInfo
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 import structlog
 from structlog.contextvars import bind_contextvars, clear_contextvars
@@ -26,16 +31,93 @@ SERVICE_NAME = "backend"
 JSON_LOG_FILE = Path(LOGS_DIR) / "app.jsonl"
 
 
-def _get_level_overrides() -> dict[str, int]:
-    overrides: dict[str, int] = {}
+class _RotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """``RotatingFileHandler`` that batches writes and tracks its own file size.
 
-    if not DEBUG:
-        overrides["app"] = logging.INFO
-
-    overrides["uvicorn.access"] = logging.CRITICAL
-    overrides["watchfiles"] = logging.WARNING
+    The stdlib implementation renders every record a second time (and stats the
+    file twice) just to measure it before ``emit`` renders it again, then flushes
+    after every line. Here the size is counted as records are written, so a file
+    may overshoot ``maxBytes`` by at most one record, and the stream is only
+    flushed for records at ``flush_level`` or above, or once ``flush_interval``
+    seconds have passed since the first unflushed write. Anything still buffered
+    at exit is flushed by ``logging.shutdown``.
+    """
 
-    return overrides
+    def __init__(self, *args, flush_level: int = logging.ERROR, flush_interval: float = 1.0, **kwargs):
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._stream_size = 0
+        self._flush_timer: threading.Timer | None = None
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        stream = super()._open()
+        # Measured once on open; ``tell()`` on a text stream would force a flush.
+        self._stream_size = stream.tell()
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.maxBytes <= 0:
+            return False
+
+        if self.stream is None:
+            self.stream = self._open()
+
+        if self._stream_size < self.maxBytes:
+            return False
+
+        # Never roll over anything other than regular files (bpo-45401)
+        return os.path.isfile(self.baseFilename)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+
+            if self.stream is None:
+                self.stream = self._open()
+
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            # ``maxBytes`` counts bytes, so non-ASCII records are measured in their encoded form
+            self._stream_size += len(msg) if msg.isascii() else len(msg.encode(self.stream.encoding or "utf-8", self.stream.errors))
+
+            if record.levelno >= self.flush_level:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            super().flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            super().close()
+
+
+# Both depend only on DEBUG, which is fixed at import, so they are built once here
+# rather than on every setup_logging() call. The overrides are read-only since
+# every call layers its own levels over this shared mapping.
+_DEFAULT_LEVEL = logging.DEBUG if DEBUG else logging.INFO
+_DEFAULT_LEVEL_OVERRIDES: Mapping[str, int] = MappingProxyType({
+    "uvicorn.access": logging.CRITICAL,
+    "watchfiles": logging.WARNING,
+})
 
 
 def _drop_color_message(logger, method_name, event_dict):
@@ -44,18 +126,21 @@ def _drop_color_message(logger, method_name, event_dict):
     return event_dict
 
 
-def _build_shared_processors() -> list:
+@lru_cache(maxsize=1)
+def _build_shared_processors() -> tuple:
     """Processors applied to *both* native structlog and foreign stdlib records.
 
     Foreign records (uvicorn, sqlalchemy) run these via the ProcessorFormatter's
     ``foreign_pre_chain``; native records run them in ``structlog.configure``.
     Keeping a single list is what makes every log line render identically.
+
+    Built once per process and returned as a tuple, since ``setup_logging`` runs
+    again for every app instance created by the factory.
     """
-    return [
+    return (
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         add_log_level,
-        _drop_color_message,
         StackInfoRenderer(),
         format_exc_info,
         # utc=True so the ISO timestamp ends in "Z" (or a numeric offset for
@@ -63,7 +148,7 @@ def _build_shared_processors() -> list:
         # offset marker and otherwise falls back to ingest time.
         TimeStamper(fmt="iso", utc=True),
         structlog.processors.UnicodeDecoder(),
-    ]
+    )
 
 
 def setup_logging(
@@ -73,15 +158,23 @@ def setup_logging(
     no_debug=False,
     global_level=None,
 ) -> None:
-    if no_debug:
-        level = logging.INFO
-    else:
-        level = logging.DEBUG if DEBUG else logging.INFO
-    level_overrides = {**_get_level_overrides(), **(level_overrides or {})}
+    level = logging.INFO if no_debug else _DEFAULT_LEVEL
+    # Applied in a single pass with one setLevel() per logger, since every call
+    # clears the logging manager's level cache.
+    logger_levels = {
+        **_DEFAULT_LEVEL_OVERRIDES,
+        **(level_overrides or {}),
+        "app": level,
+        "root": logging.WARNING,
+    }
     shared_processors = _build_shared_processors()
 
     structlog.configure(
         processors=[
+            # Drop events below the stdlib logger's level before any processor
+            # runs, and only then interpolate %-style positional arguments.
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
             *shared_processors,
             # Hand the event dict off to the stdlib ProcessorFormatter instead of
             # rendering here, so native and foreign records share one renderer.
@@ -93,16 +186,25 @@ def setup_logging(
         cache_logger_on_first_use=True,
     )
 
-    for name, log_level in level_overrides.items():
+    for name, log_level in logger_levels.items():
         logging.getLogger(name).setLevel(log_level)
 
-    logging.getLogger("app").setLevel(level)
-    logging.getLogger("root").setLevel(logging.WARNING)
-
     _configure_stdlib_bridge(shared_processors)
+    # Proxies handed out before this call may already be bound to the previous
+    # configuration; later get_logger() calls must start from fresh ones.
+    _get_cached_logger.cache_clear()
+
 
+def _build_foreign_pre_chain(shared_processors: tuple) -> list:
+    """Processors for records that did not originate from structlog.
+
+    ``color_message`` is only ever attached by uvicorn's stdlib loggers, so dropping
+    it is confined to this chain instead of running on every native log call.
+    """
+    return [_drop_color_message, *shared_processors]
 
-def _build_handlers(shared_processors: list) -> list[logging.Handler]:
+
+def _build_handlers(shared_processors: tuple) -> list[logging.Handler]:
     """Two independent sinks fed by the same log records.
 
     Console: human-readable, always on, whatever runs `docker compose logs`
@@ -112,16 +214,30 @@ def _build_handlers(shared_processors: list) -> list[logging.Handler]:
     Splitting these out means neither audience has to compromise, and no
     LOG_FORMAT env var is needed to pick one over the other.
     """
+    foreign_pre_chain = _build_foreign_pre_chain(shared_processors)
     console_formatter = ProcessorFormatter(
         processors=[
             ProcessorFormatter.remove_processors_meta,
             ConsoleRenderer(colors=True),
         ],
-        foreign_pre_chain=shared_processors,
+        foreign_pre_chain=foreign_pre_chain,
     )
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
 
+    return [console_handler, _build_json_handler(shared_processors)]
+
+
+@lru_cache(maxsize=1)
+def _build_json_handler(shared_processors: tuple) -> logging.Handler:
+    """Build the JSON file sink once per process.
+
+    Reconfiguring must not open a fresh file descriptor on ``app.jsonl`` each time
+    (the replaced handler was never closed), so the handler is reused instead. The
+    console handler is still rebuilt per call so it follows the current ``sys.stdout``.
+    """
+    foreign_pre_chain = _build_foreign_pre_chain(shared_processors)
+
     JSON_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     json_formatter = ProcessorFormatter(
@@ -129,19 +245,19 @@ def _build_handlers(shared_processors: list) -> list[logging.Handler]:
             ProcessorFormatter.remove_processors_meta,
             structlog.processors.JSONRenderer(sort_keys=True, ensure_ascii=False),
         ],
-        foreign_pre_chain=shared_processors,
+        foreign_pre_chain=foreign_pre_chain,
     )
-    json_handler = logging.handlers.RotatingFileHandler(
+    json_handler = _RotatingFileHandler(
         JSON_LOG_FILE,
         maxBytes=50 * 1024 * 1024,
         backupCount=5,
     )
     json_handler.setFormatter(json_formatter)
 
-    return [console_handler, json_handler]
+    return json_handler
 
 
-def _configure_stdlib_bridge(shared_processors: list) -> None:
+def _configure_stdlib_bridge(shared_processors: tuple) -> None:
     handlers = _build_handlers(shared_processors)
 
     root = logging.getLogger()
@@ -158,7 +274,22 @@ def _configure_stdlib_bridge(shared_processors: list) -> None:
 
 
 def get_logger(name: str, **kwargs) -> structlog.stdlib.BoundLogger:
-    return structlog.get_logger(name, service=SERVICE_NAME, **kwargs)
+    try:
+        return _get_cached_logger(name, tuple(sorted(kwargs.items())))
+    except TypeError:  # Unhashable initial values
+        return structlog.get_logger(name, service=SERVICE_NAME, **kwargs)
+
+
+@lru_cache(maxsize=256)
+def _get_cached_logger(name: str, initial_values: tuple) -> structlog.stdlib.BoundLogger:
+    """Share one lazy logger proxy per name and initial values.
+
+    Loggers are also fetched per instance (seeders, services), so reusing the proxy
+    means ``cache_logger_on_first_use`` binds each distinct logger only once. The
+    cache is cleared by ``setup_logging``; loggers already held (e.g. module-level
+    ones) keep whichever configuration they were first used under.
+    """
+    return structlog.get_logger(name, service=SERVICE_NAME, **dict(initial_values))
 
 
 def clear_request_context() -> None:
@@ -166,6 +297,21 @@ def clear_request_context() -> None:
     bind_contextvars(request_id=None)
 
 
+@lru_cache(maxsize=512)
+def _relative_source_path(filename: str) -> Path:
+    """Resolve a frame's filename relative to the project root, once per file.
+
+    ``Path.resolve`` hits the filesystem, and the set of calling files is small and
+    fixed, so the result is cached per filename.
+    """
+    path = Path(filename).resolve()
+
+    try:
+        return path.relative_to(PROJECT_ROOT)
+    except ValueError:
+        return path
+
+
 def log_stack_warning(
     logger: structlog.stdlib.BoundLogger,
     stack: list[FrameInfo],
@@ -175,12 +321,7 @@ def log_stack_warning(
     caller_frame = stack[frame]
     lineno = caller_frame.lineno
     function = caller_frame.function
-    filename = Path(caller_frame.filename).resolve()
-
-    try:
-        relative_path = filename.relative_to(PROJECT_ROOT)
-    except ValueError:
-        relative_path = filename
+    relative_path = _relative_source_path(caller_frame.filename)
 
     logger.warning(
         "%s | Called from: %s (%s:%s)",
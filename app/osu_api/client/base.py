@@ -71,6 +71,7 @@ class OsuAPIClientBase:
         # or failing token refresh takes down every other osu! API call with it.
         self._oauth = OAuth(transport=OsuAPIMetricsTransport(httpx.AsyncHTTPTransport()))
         self._token: OsuClientOAuthToken | None = None
+        self._authorization: tuple[OsuClientOAuthToken, str] | None = None
         self._http_client = httpx.AsyncClient(
             transport=OsuAPIMetricsTransport(httpx.AsyncHTTPTransport()),
             timeout=httpx.Timeout(10.0, connect=5.0)
@@ -87,7 +88,7 @@ class OsuAPIClientBase:
                     if token_.expires_at > time.time():
                         return token_
                 except (ValidationError, ValueError) as e:
-                    logger.warning(f"Error when deserializing from redis cache: {e}, falling back to refreshing token")
+                    logger.warning("Error when deserializing from redis cache: %s, falling back to refreshing token", e)
 
             return None
 
@@ -131,7 +132,20 @@ class OsuAPIClientBase:
                 raise TimeoutError(f"Failed to fetch token after {MAX_TOKEN_FETCH_RETRIES} retries due to ReadTimeout")
 
     async def get_auth_headers(self, access_token: str = None) -> dict:
-        return {"Authorization": f"Bearer {access_token or await self.get_token()}"}
+        if access_token:
+            return {"Authorization": f"Bearer {access_token}"}
+
+        token = self._token
+
+        if token is None or token.expires_at <= time.time():
+            await self.get_token()
+            token = self._token
+
+        # Reuse the formatted header for as long as the same token is held in memory
+        if self._authorization is None or self._authorization[0] is not token:
+            self._authorization = (token, f"Bearer {token.access_token}")
+
+        return {"Authorization": self._authorization[1]}
 
     async def close(self) -> None:
         await self._http_client.aclose()
@@ -141,9 +155,3 @@ class OsuAPIClientBase:
 
     async def __aexit__(self, *args):
         await self.close()
-
-    @staticmethod
-    def format_query_parameters(query_parameters: dict) -> str:
-        from urllib.parse import urlencode
-
-        return f"?{urlencode(query_parameters)}"
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Union, Optional
 
 import httpx
@@ -11,6 +12,11 @@ from .base import OsuAPIClientBase
 
 logger = get_logger(__name__)
 
+_JSON_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+})
+
 
 class OsuAPIClient(OsuAPIClientBase):
     # Beatmaps
@@ -23,7 +29,7 @@ class OsuAPIClient(OsuAPIClientBase):
                 try:
                     return Beatmap.deserialize(serialized_beatmap)
                 except (ValidationError, ValueError) as e:
-                    logger.warning(f"Error when deserializing from redis cache: {e}")
+                    logger.warning("Error when deserializing from redis cache: %s", e)
 
             return None
 
@@ -32,11 +38,7 @@ class OsuAPIClient(OsuAPIClientBase):
 
         url = APIEndpoint.BEATMAP.format(beatmap=beatmap_id)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         response = await self._http_client.get(url, headers=headers)
 
@@ -44,8 +46,10 @@ class OsuAPIClient(OsuAPIClientBase):
         beatmap_data = response.json()
 
         cached_beatmap = Beatmap.model_validate(beatmap_data)
-        await self.rc.hset(cached_beatmap_hash_name, mapping=cached_beatmap.serialize())
-        await self.rc.expire(cached_beatmap_hash_name, CACHED_BEATMAP_EXPIRY)
+        async with self.rc.pipeline(transaction=False) as pipe:
+            pipe.hset(cached_beatmap_hash_name, mapping=cached_beatmap.serialize())
+            pipe.expire(cached_beatmap_hash_name, CACHED_BEATMAP_EXPIRY)
+            await pipe.execute()
 
         return beatmap_data
 
@@ -53,11 +57,7 @@ class OsuAPIClient(OsuAPIClientBase):
     async def get_beatmap_scores(self, beatmap_id: int, limit: int | None = None, offset: int | None = None) -> dict:
         url = APIEndpoint.BEATMAP_SCORES.format(beatmap=beatmap_id)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         query_parameters: dict[str, int] = {}
 
@@ -67,9 +67,7 @@ class OsuAPIClient(OsuAPIClientBase):
         if offset is not None:
             query_parameters["offset"] = offset
 
-        url += self.format_query_parameters(query_parameters)
-
-        response = await self._http_client.get(url, headers=headers)
+        response = await self._http_client.get(url, headers=headers, params=query_parameters)
 
         response.raise_for_status()
         return response.json()
@@ -78,11 +76,7 @@ class OsuAPIClient(OsuAPIClientBase):
     async def get_beatmap_attributes(self, beatmap_id: int, mods: list[int]) -> dict:
         url = APIEndpoint.BEATMAP_ATTRIBUTES.format(beatmap=beatmap_id)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
         body = {
             "mods": mods
         }
@@ -102,7 +96,7 @@ class OsuAPIClient(OsuAPIClientBase):
                 try:
                     return Beatmapset.deserialize(serialized_beatmapset)
                 except (ValidationError, ValueError) as e:
-                    logger.warning(f"Error when deserializing from redis cache: {e}, falling back to fetching directly from osu! API")
+                    logger.warning("Error when deserializing from redis cache: %s, falling back to fetching directly from osu! API", e)
 
             return None
 
@@ -111,11 +105,7 @@ class OsuAPIClient(OsuAPIClientBase):
 
         url = APIEndpoint.BEATMAPSET.format(beatmapset=beatmapset_id)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         response = await self._http_client.get(url, headers=headers)
 
@@ -123,8 +113,10 @@ class OsuAPIClient(OsuAPIClientBase):
         beatmapset_data = response.json()
 
         cached_beatmapset = Beatmapset.model_validate(beatmapset_data)
-        await self.rc.hset(cached_beatmapset_hash_name, mapping=cached_beatmapset.serialize())
-        await self.rc.expire(cached_beatmapset_hash_name, CACHED_BEATMAPSET_EXPIRY)
+        async with self.rc.pipeline(transaction=False) as pipe:
+            pipe.hset(cached_beatmapset_hash_name, mapping=cached_beatmapset.serialize())
+            pipe.expire(cached_beatmapset_hash_name, CACHED_BEATMAPSET_EXPIRY)
+            await pipe.execute()
 
         return beatmapset_data
     
@@ -138,11 +130,7 @@ class OsuAPIClient(OsuAPIClientBase):
         """Fetch beatmapsets by status using discussions endpoint."""
         url = APIEndpoint.BEATMAPSET_DISCUSSIONS.format()
         
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
         
         query_parameters: dict[str, Union[int, str]] = {
             "beatmapset_status": beatmapset_status,
@@ -150,9 +138,7 @@ class OsuAPIClient(OsuAPIClientBase):
             "limit": limit,
         }
         
-        url += self.format_query_parameters(query_parameters)
-
-        response = await self._http_client.get(url, headers=headers)
+        response = await self._http_client.get(url, headers=headers, params=query_parameters)
         
         response.raise_for_status()
         return response.json()
@@ -177,11 +163,7 @@ class OsuAPIClient(OsuAPIClientBase):
         """
         url = APIEndpoint.BEATMAPSET_SEARCH.format()
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         query_parameters: dict[str, Union[int, str]] = {}
 
@@ -202,9 +184,7 @@ class OsuAPIClient(OsuAPIClientBase):
         if sort is not None:
             query_parameters["sort"] = sort
 
-        url += self.format_query_parameters(query_parameters)
-
-        response = await self._http_client.get(url, headers=headers)
+        response = await self._http_client.get(url, headers=headers, params=query_parameters)
 
         response.raise_for_status()
         return response.json()
@@ -212,13 +192,9 @@ class OsuAPIClient(OsuAPIClientBase):
     # Users
     @rate_limit(min_interval=0.5, limit_per_window=120, window_size=60)
     async def get_own_data(self, access_token: str) -> dict:
-        url = APIEndpoint.ME.value
+        url = APIEndpoint.ME
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers(access_token)
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers(access_token)}
 
         response = await self._http_client.get(url, headers=headers)
 
@@ -227,13 +203,9 @@ class OsuAPIClient(OsuAPIClientBase):
 
     @rate_limit(min_interval=0.5, limit_per_window=120, window_size=60)
     async def get_user_scores(self, user_id: int, score_type: ScoreType, legacy_only: int = 0, include_fails: int = 0, mode: Ruleset | None = None, limit: int | None = None, offset: int | None = None) -> dict:
-        url = APIEndpoint.SCORES.format(user=user_id, type=score_type.value)
+        url = APIEndpoint.SCORES.format(user=user_id, type=score_type)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         query_parameters: dict[str, Union[int, str]] = {
             "legacy_only": legacy_only,
@@ -241,7 +213,7 @@ class OsuAPIClient(OsuAPIClientBase):
         }
 
         if mode is not None:
-            query_parameters["mode"] = mode.value
+            query_parameters["mode"] = mode
 
         if limit is not None:
             query_parameters["limit"] = limit
@@ -249,23 +221,16 @@ class OsuAPIClient(OsuAPIClientBase):
         if offset is not None:
             query_parameters["offset"] = offset
 
-        url += self.format_query_parameters(query_parameters)
-
-        response = await self._http_client.get(url, headers=headers)
+        response = await self._http_client.get(url, headers=headers, params=query_parameters)
 
         response.raise_for_status()
         return response.json()
 
     @rate_limit(min_interval=0.5, limit_per_window=120, window_size=60)
     async def get_user(self, user_id: int, mode: Ruleset | None = None) -> dict:
-        mode_str = mode.value if mode is not None else ""
-        url = APIEndpoint.USER.format(user=user_id, mode=mode_str)
+        url = APIEndpoint.USER.format(user=user_id, mode=mode)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         response = await self._http_client.get(url, headers=headers)
 
@@ -275,13 +240,9 @@ class OsuAPIClient(OsuAPIClientBase):
     # Tags
     @rate_limit(min_interval=0.5, limit_per_window=120, window_size=60)
     async def get_tags(self) -> dict[str, list[dict[str, Union[int, str]]]]:
-        url = APIEndpoint.TAGS.value
+        url = APIEndpoint.TAGS
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         response = await self._http_client.get(url, headers=headers)
 
@@ -290,13 +251,9 @@ class OsuAPIClient(OsuAPIClientBase):
 
     @rate_limit(min_interval=0.5, limit_per_window=120, window_size=60)
     async def get_rankings(self, ruleset: Ruleset, mode: str, limit: int | None = None, offset: int | None = None, cursor_page: int | None = None) -> dict:
-        url = APIEndpoint.RANKINGS.format(ruleset=ruleset.value, mode=mode)
+        url = APIEndpoint.RANKINGS.format(ruleset=ruleset, mode=mode)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **await self.get_auth_headers()
-        }
+        headers = {**_JSON_HEADERS, **await self.get_auth_headers()}
 
         query_parameters: dict[str, Union[int, str]] = {}
 
@@ -309,9 +266,7 @@ class OsuAPIClient(OsuAPIClientBase):
         if cursor_page is not None:
             query_parameters["cursor[page]"] = cursor_page
 
-        url += self.format_query_parameters(query_parameters)
-
-        response = await self._http_client.get(url, headers=headers)
+        response = await self._http_client.get(url, headers=headers, params=query_parameters)
 
         response.raise_for_status()
         return response.json()
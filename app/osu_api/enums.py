@@ -1,4 +1,4 @@
-from enum import Enum, IntEnum
+from enum import Enum, IntEnum, StrEnum
 
 __all__ = [
     "APIEndpoint",
@@ -16,7 +16,7 @@ __all__ = [
 API_BASEURL = "https://osu.ppy.sh/api/v2"
 
 
-class APIEndpoint(Enum):
+class APIEndpoint(StrEnum):
     # Beatmaps
     BEATMAP_PACKS = API_BASEURL + "/beatmaps/packs"
     BEATMAP_LOOKUP = API_BASEURL + "/beatmaps/lookup"
@@ -45,19 +45,21 @@ class APIEndpoint(Enum):
     TAGS = API_BASEURL + "/tags"
 
     def format(self, *args, **kwargs) -> str:
-        args = [arg if arg is not None else "" for arg in args]
-        kwargs = {key: value if value is not None else "" for key, value in kwargs.items()}
+        # Only rebuild the arguments when there is actually a None to blank out
+        if None in args or None in kwargs.values():
+            args = [arg if arg is not None else "" for arg in args]
+            kwargs = {key: value if value is not None else "" for key, value in kwargs.items()}
 
-        return str.format(self.value, *args, **kwargs).rstrip("/")
+        return self.value.format(*args, **kwargs).rstrip("/")
 
 
-class ScoreType(Enum):
+class ScoreType(StrEnum):
     BEST = "best"
     FIRSTS = "firsts"
     RECENT = "recent"
 
 
-class Ruleset(Enum):
+class Ruleset(StrEnum):
     FRUITS = "fruits"
     MANIA = "mania"
     OSU = "osu"
@@ -103,7 +105,7 @@ class RankedInt(IntEnum):
     LOVED = 4
 
 
-class RankedStatus(Enum):
+class RankedStatus(StrEnum):
     GRAVEYARD = "graveyard"
     WIP = "wip"
     PENDING = "pending"
@@ -131,7 +133,7 @@ class GenreId(IntEnum):
     JAZZ = 14
 
 
-class GenreName(Enum):
+class GenreName(StrEnum):
     ANY = "Any"
     UNSPECIFIED = "Unspecified"
     VIDEO_GAME = "Video Game"
@@ -166,7 +168,7 @@ class LanguageId(IntEnum):
     OTHER = 14
 
 
-class LanguageName(Enum):
+class LanguageName(StrEnum):
     ANY = "Any"
     UNSPECIFIED = "Unspecified"
     ENGLISH = "English"
@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache
+from typing import Callable
 
 from connexion.lifecycle import ConnexionRequest
 from connexion.validators import ParameterValidator
@@ -6,7 +8,25 @@ from connexion.validators import ParameterValidator
 from app.exceptions import ArrayValidationError, DeepObjectValidationError, bad_request_factory
 from app.spec import get_filter_schema, get_include_schema
 from app.config import API_BASE_PATH
-from .validators import validate_sorting, validate_filters, validate_include
+from .validators import validate_sorting, validate_filters, get_include_validator
+
+_SEARCH_PATH = os.path.join(API_BASE_PATH.rstrip("/"), "search")
+
+
+@lru_cache(maxsize=None)
+def _get_filter_schema(schema_title: str) -> dict:
+    """Return the resolved filter schema for a schema title, resolving it on first use."""
+    return get_filter_schema(schema_name=schema_title)
+
+
+@lru_cache(maxsize=None)
+def _get_include_validator(schema_title: str) -> Callable[[dict], None]:
+    """Return the compiled validator for an include schema, building it on first use.
+
+    Connexion instantiates a new parameter validator for every request, so compiled
+    validators are cached at module level keyed by the (static) schema title.
+    """
+    return get_include_validator(get_include_schema(schema_name=schema_title))
 
 
 class ParameterValidatorPatched(ParameterValidator):
@@ -15,7 +35,7 @@ class ParameterValidatorPatched(ParameterValidator):
     Adds:
         - Structured validation for `sorting`
         - Deep-object validation for `include`
-        - Request-scope tracking for context-aware validation
+        - Route-aware include validation via the request's ASGI scope
         - Custom error translation into HTTP 400 responses
 
     Addresses Connexion limitations around complex query schemas.
@@ -28,17 +48,16 @@ class ParameterValidatorPatched(ParameterValidator):
         security_query_params=None
     ):
         super().__init__(parameters, uri_parser, strict_validation=strict_validation, security_query_params=security_query_params)
-        self.request_scopes: dict[ConnexionRequest, dict] = {}
 
     def validate_query_parameter(self, param: dict, request: ConnexionRequest):
         """Validate query parameters with custom include/sorting logic.
 
         Special handling:
             - `sorting`: Field/order validation against schema enums.
-            - `include`: Recursive deep-object validation against dynamically resolved
-              include schemas. `/search` validation is deferred due to schema ambiguity.
-            - `filters`: Recursive deep-object validation against dynamically resolved
-              filter schemas.
+            - `include`: Deep-object validation against a validator compiled once per
+              include schema. `/search` validation is deferred due to schema ambiguity.
+            - `filters`: Recursive deep-object validation against filter schemas
+              resolved once per schema title.
 
         Args:
             param:
@@ -63,41 +82,23 @@ class ParameterValidatorPatched(ParameterValidator):
                 raise bad_request_factory(e)
         elif param_name == "filters" and value:
             try:
-                resolved_schema = get_filter_schema(schema_name=param["schema"]["title"])  # Connexion doesn't expose the schema title here; we resolve it manually.
+                resolved_schema = _get_filter_schema(param["schema"]["title"])  # Connexion doesn't expose the schema title here; we resolve it manually.
                 return validate_filters(value, resolved_schema)
             except DeepObjectValidationError as e:
                 raise bad_request_factory(e)
         elif param_name == "include" and value:
             try:
-                request_scope = self.request_scopes.get(request, {})
-                scope_path = request_scope.get("path", "")
-                if scope_path.endswith(os.path.join(API_BASE_PATH.rstrip("/"), "search")):
+                scope_path = request.scope.get("path", "")
+                if scope_path.endswith(_SEARCH_PATH):
                     # The /search include schema is ambiguous due to multiple possibilities depending on the scope
                     # Neither the scope nor the respective include schema can be determined at this point
                     # Delegate this validation to be run by the operation function where the context is available
                     return None
 
-                resolved_schema = get_include_schema(schema_name=param["schema"]["title"])  # Connexion doesn't expose the schema title here; we resolve it manually.
-                return validate_include(value, resolved_schema)
+                validate_include = _get_include_validator(param["schema"]["title"])  # Connexion doesn't expose the schema title here; we resolve it manually.
+                return validate_include(value)
             except DeepObjectValidationError as e:
                 raise bad_request_factory(e)
 
         return self.validate_parameter("query", value, param, param_name=param_name)
 
-    def validate(self, scope: dict):
-        """Validate request scope while tracking context.
-
-        Temporarily stores request scope to allow context-aware validation (e.g.,
-        route-specific include behavior).
-
-        Args:
-            scope:
-                ASGI request scope dictionary.
-        """
-        request = ConnexionRequest(scope, uri_parser=self.uri_parser)
-
-        try:
-            self.request_scopes[request] = scope
-            self.validate_request(request)
-        finally:
-            del self.request_scopes[request]
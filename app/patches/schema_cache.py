@@ -0,0 +1,39 @@
+from functools import wraps
+from typing import Callable, TypeVar
+
+__all__ = [
+    "cache_by_schema"
+]
+
+T = TypeVar("T")
+
+
+def cache_by_schema(func: Callable[[dict], T]) -> Callable[[dict], T]:
+    """Memoize a function of an OpenAPI schema dict on the dict's identity.
+
+    Schema dicts are unhashable, but the ones loaded from the spec live as long as the app,
+    so results are keyed by ``id(schema)``. Each entry keeps a reference to its schema,
+    which stops the id from being reused while the entry exists.
+
+    Args:
+        func:
+            Function taking a schema dict as its only argument.
+
+    Returns:
+        The memoized function, with a ``cache_clear()`` method.
+    """
+    cache: dict[int, tuple[dict, T]] = {}
+
+    @wraps(func)
+    def wrapper(schema: dict) -> T:
+        if (cached := cache.get(id(schema))) is not None:
+            return cached[1]
+
+        result = func(schema)
+        cache[id(schema)] = (schema, result)
+
+        return result
+
+    wrapper.cache_clear = cache.clear
+
+    return wrapper
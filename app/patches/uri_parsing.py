@@ -1,16 +1,194 @@
 import json
 import re
+import sys
 from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping
 
 from connexion.uri_parsing import OpenAPIURIParser
 from connexion.utils import coerce_type, TypeValidationError
 
 from app.logging import get_logger
-
-affirmative_literals = {"true", "t", "yes", "y"}
-negative_literals = {"false", "f", "no", "n"}
+from .schema_cache import cache_by_schema
+from .validators import intern_sorting_item
+
+affirmative_literals = frozenset({"true", "t", "yes", "y"})
+negative_literals = frozenset({"false", "f", "no", "n"})
+boolean_literals = affirmative_literals | negative_literals
+filter_true_literals = frozenset({"true", "True", "TRUE"})
+filter_false_literals = frozenset({"false", "False", "FALSE"})
 logger = get_logger(__name__)
 
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.fromisoformat  # Accepts a trailing "Z" natively
+else:
+    def _fromisoformat(value: str) -> datetime:
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+# Shared schema for values without one; never mutated
+_EMPTY_SCHEMA: dict = {}
+
+
+@cache_by_schema
+def _get_oneof_branch_table(schema: dict) -> Mapping[str, dict]:
+    """Map each branch type of a ``oneOf`` schema to its first branch, building the table once per schema."""
+    table = {}
+
+    for branch in schema["oneOf"]:
+        table.setdefault(branch.get("type"), branch)
+
+    return MappingProxyType(table)
+
+
+def _resolve_oneof(schema, data):
+    if not isinstance(schema, dict):
+        return schema
+
+    if "oneOf" not in schema:
+        return schema
+
+    branches = _get_oneof_branch_table(schema)
+
+    if isinstance(data, dict):
+        branch = branches.get("object")
+    elif isinstance(data, list):
+        branch = branches.get("array")
+    elif isinstance(data, bool) or isinstance(data, str) and (data in boolean_literals or data.lower() in boolean_literals):
+        branch = branches.get("boolean")
+    else:
+        branch = None
+
+    return branch if branch is not None else schema["oneOf"][0]
+
+
+def _cast_include_str(stack, container, key, data, schema):
+    # Exact-case literals (the common case) are matched without allocating a lowered copy
+    if data in affirmative_literals:
+        container[key] = True
+    elif data in negative_literals:
+        container[key] = False
+    else:
+        lower = data.lower()
+
+        if lower in affirmative_literals:
+            container[key] = True
+        elif lower in negative_literals:
+            container[key] = False
+        else:
+            container[key] = data
+
+
+def _cast_include_dict(stack, container, key, data, schema):
+    new_dict = container[key] = dict(data)
+    push = stack.append
+
+    if isinstance(schema, dict):
+        schema = _resolve_oneof(schema, data)
+        properties = schema.get("properties") or _EMPTY_SCHEMA
+        additional = schema.get("additionalProperties")
+        fallback = additional if isinstance(additional, dict) else _EMPTY_SCHEMA
+
+        for k, v in data.items():
+            push((new_dict, k, v, properties.get(k, fallback)))
+    else:
+        for k, v in data.items():
+            push((new_dict, k, v, _EMPTY_SCHEMA))
+
+
+def _cast_include_list(stack, container, key, data, schema):
+    new_list = container[key] = list(data)
+    items_schema = schema.get("items", _EMPTY_SCHEMA) if isinstance(schema, dict) else _EMPTY_SCHEMA
+    push = stack.append
+
+    for i, v in enumerate(data):
+        push((new_list, i, v, items_schema))
+
+
+# Query-string parsing only produces these exact types; anything else is passed through unchanged
+_INCLUDE_CAST_HANDLERS = MappingProxyType({
+    str: _cast_include_str,
+    dict: _cast_include_dict,
+    list: _cast_include_list,
+})
+
+
+def _cast_include(data, schema):
+    # Walk nested containers with an explicit stack of (container, key, data, schema) entries. Each
+    # container is copied from its input first, so insertion order is preserved and values without a
+    # handler keep their original value
+    result = [data]
+    stack = [(result, 0, data, schema)]
+
+    while stack:
+        container, key, data, schema = stack.pop()
+
+        if (handler := _INCLUDE_CAST_HANDLERS.get(type(data))) is not None:
+            handler(stack, container, key, data, schema)
+
+    return result[0]
+
+
+def _cast_filter(data):
+    if isinstance(data, str):
+        if data in filter_true_literals:
+            return True
+        if data in filter_false_literals:
+            return False
+
+        if not data or data[0].isalpha():
+            # Neither a datetime nor a number can start with a letter, so only booleans remain
+            if len(data) in (4, 5):
+                # Mixed-case long tail; no other string can lower to "true" or "false"
+                lower = data.lower()
+
+                if lower == "true":
+                    return True
+                if lower == "false":
+                    return False
+
+            return data
+
+        if len(data) >= 7 and data[:4].isdigit():
+            # Every ISO 8601 form accepted by fromisoformat starts with a four-digit year
+            try:
+                return _fromisoformat(data)
+            except ValueError:
+                pass
+
+        try:
+            if "." in data:
+                return float(data)
+            return int(data)
+        except ValueError:
+            return data
+
+    if isinstance(data, dict):
+        # Copy on first change so containers with nothing to coerce are returned as-is
+        coerced = None
+
+        for k, v in data.items():
+            if (new_v := _cast_filter(v)) is not v:
+                if coerced is None:
+                    coerced = dict(data)
+
+                coerced[k] = new_v
+
+        return data if coerced is None else coerced
+
+    if isinstance(data, list):
+        coerced = None
+
+        for i, v in enumerate(data):
+            if (new_v := _cast_filter(v)) is not v:
+                if coerced is None:
+                    coerced = list(data)
+
+                coerced[i] = new_v
+
+        return data if coerced is None else coerced
+
+    return data
+
 
 class OpenAPIURIParserPatched(OpenAPIURIParser):
     """Extended OpenAPI URI parser with custom coercion logic.
@@ -151,12 +329,13 @@ class OpenAPIURIParserPatched(OpenAPIURIParser):
 
     @staticmethod
     def coerce_include(param, value, parameter_type, parameter_name=None):
-        """Recursively coerce deep-object include parameters.
+        """Coerce deep-object include parameters.
 
         Supports:
             - Boolean string casting (``"true"``/``"false"``)
             - oneOf schema branch resolution
-            - Recursive object and array casting
+            - Nested object and array casting via an explicit work stack, dispatching
+              on each value's exact type
 
         Args:
             param:
@@ -173,74 +352,10 @@ class OpenAPIURIParserPatched(OpenAPIURIParser):
         """
         param_schema = param.get("schema", param)
 
-        def resolve_oneof(schema, data):
-            if not isinstance(schema, dict):
-                return schema
-
-            if "oneOf" not in schema:
-                return schema
-
-            for branch in schema["oneOf"]:
-                branch_type = branch.get("type")
-
-                if branch_type == "object" and isinstance(data, dict):
-                    return branch
-
-                if branch_type == "array" and isinstance(data, list):
-                    return branch
-
-                if branch_type == "boolean" and (
-                    isinstance(data, bool) or
-                    isinstance(data, str) and
-                    data.lower() in affirmative_literals | negative_literals
-                ):
-                    return branch
-
-            return schema["oneOf"][0]
-
-        def cast(data, schema):
-            if isinstance(data, str):
-                lower = data.lower()
-
-                if lower in affirmative_literals:
-                    return True
-                elif lower in negative_literals:
-                    return False
-
-            if isinstance(data, dict):
-                if isinstance(schema, dict):
-                    schema = resolve_oneof(schema, data)
-                    properties = schema.get("properties")
-                    additional = schema.get("additionalProperties")
-
-                    new_dict = {}
-
-                    for k, v in data.items():
-                        if properties and k in properties:
-                            new_dict[k] = cast(v, properties[k])
-                        elif isinstance(additional, dict):
-                            new_dict[k] = cast(v, additional)
-                        else:
-                            new_dict[k] = cast(v, {})
-
-                    return new_dict
-
-                return {k: cast(v, {}) for k, v in data.items()}
-
-            if isinstance(data, list):
-                if isinstance(schema, dict):
-                    items_schema = schema.get("items", {})
-                else:
-                    items_schema = {}
-
-                return [cast(v, items_schema) for v in data]
-
-            return data
-
         if isinstance(value, list) and len(value) == 1:
-            return cast(value[0], param_schema)
+            return _cast_include(value[0], param_schema)
 
-        return cast(value, param_schema)
+        return _cast_include(value, param_schema)
 
     @staticmethod
     def coerce_sorting(param, value, parameter_type, parameter_name=None):
@@ -286,7 +401,7 @@ class OpenAPIURIParserPatched(OpenAPIURIParser):
 
             try:
                 if isinstance(item, str):
-                    coerced.append(json.loads(item))
+                    coerced.append(intern_sorting_item(json.loads(item)))
                 else:
                     coerced.append(item)
             except json.JSONDecodeError:
@@ -317,36 +432,7 @@ class OpenAPIURIParserPatched(OpenAPIURIParser):
         Returns:
             Coerced filters structure matching schema shape.
         """
-        def cast(data):
-            if isinstance(data, str):
-                lower = data.lower()
-
-                if lower == "true":
-                    return True
-                if lower == "false":
-                    return False
-
-                try:
-                    return datetime.fromisoformat(data.replace("Z", "+00:00"))
-                except ValueError:
-                    pass
-
-                try:
-                    if "." in data:
-                        return float(data)
-                    return int(data)
-                except ValueError:
-                    return data
-
-            if isinstance(data, dict):
-                return {k: cast(v) for k, v in data.items()}
-
-            if isinstance(data, list):
-                return [cast(v) for v in data]
-
-            return data
-
         if isinstance(value, list) and len(value) == 1:
-            return cast(value[0])
+            return _cast_filter(value[0])
 
-        return cast(value)
+        return _cast_filter(value)
@@ -1,3 +1,3 @@
-from .sorting import validate_sorting
+from .sorting import validate_sorting, compile_sorting_validator, intern_sorting_item
 from .filters import validate_filters
-from .include import validate_include
+from .include import validate_include, compile_include_validator, get_include_validator
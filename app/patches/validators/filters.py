@@ -1,7 +1,20 @@
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from app.exceptions import DeepObjectValidationError
+from ..schema_cache import cache_by_schema
+
+# Python types each primitive branch type accepts (mirrors the checks in ``validate_value``)
+_BRANCH_VALUE_TYPES: Mapping[str, type | tuple[type, ...]] = MappingProxyType({
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+})
 
 
 def validate_filters(filters: dict, schema: dict, path: list[str] = None):
@@ -21,60 +34,125 @@ def validate_filters(filters: dict, schema: dict, path: list[str] = None):
         schema:
             OpenAPI schema fragment describing allowed filter structure.
         path:
-            Internal recursion path (used for error reporting).
+            Path prefix used for error reporting.
 
     Raises:
         DeepObjectValidationError:
             If any filter does not conform to the schema definition, including unknown
             fields, type mismatches, invalid nested structures, or format violations.
     """
-    if path is None:
-        path = []
+    if not filters and isinstance(filters, dict):
+        return
+
+    _validate_filters(filters, schema, list(path) if path else [])
 
+
+def _validate_filters(filters: dict, schema: dict, path: list[str]):
+    # ``path`` is extended in place around each key; raise sites snapshot it with tuple(path)
     if not isinstance(filters, dict):
-        raise DeepObjectValidationError(path, "Expected a dict for filter object")
+        raise DeepObjectValidationError(tuple(path), "Expected a dict for filter object")
 
     properties = schema.get("properties", {})
 
     for key, value in filters.items():
-        current_path = path + [key]
+        path.append(key)
 
         if key not in properties:
-            raise DeepObjectValidationError(current_path, "Unknown filter field")
+            raise DeepObjectValidationError(tuple(path), "Unknown filter field")
 
         prop_schema = properties[key]
 
         if "oneOf" in prop_schema:
-            matched = False
-            last_error = None
+            depth = len(path)
 
-            for branch in prop_schema["oneOf"]:
+            # Only try the branches whose type can accept this value; the first one that passes wins
+            for branch in _get_oneof_candidates(prop_schema, type(value)):
                 try:
-                    branch_type = branch.get("type")
+                    if branch.get("type") == "object":
+                        _validate_filters(value, branch, path)
+                    else:
+                        _validate_value(value, branch, path)
+                    break
+                except DeepObjectValidationError:
+                    del path[depth:]  # Discard keys left behind by the failed branch
+            else:
+                _validate_oneof_exhaustively(value, prop_schema, path)
+        else:
+            _validate_value(value, prop_schema, path)
 
-                    if branch_type == "object":
-                        if not isinstance(value, dict):
-                            continue
+        path.pop()
 
-                        validate_filters(value, branch, current_path)
-                        matched = True
-                        break
-                    else:
-                        if isinstance(value, dict):
-                            continue
 
-                        validate_value(value, branch, current_path)
-                        matched = True
-                        break
-                except DeepObjectValidationError as e:
-                    last_error = e
+def _validate_oneof_exhaustively(value: Any, prop_schema: dict, path: list[str]):
+    # Try every branch in declaration order, reporting the error of the last branch tried. Only
+    # reached once no type-compatible branch matched, so this is the error path
+    matched = False
+    last_error = None
+    depth = len(path)
+
+    for branch in prop_schema["oneOf"]:
+        try:
+            branch_type = branch.get("type")
+
+            if branch_type == "object":
+                if not isinstance(value, dict):
+                    continue
+
+                _validate_filters(value, branch, path)
+                matched = True
+                break
+            else:
+                if isinstance(value, dict):
+                    continue
+
+                _validate_value(value, branch, path)
+                matched = True
+                break
+        except DeepObjectValidationError as e:
+            last_error = e
+            del path[depth:]  # Discard keys left behind by the failed branch
+
+    if not matched:
+        raise last_error or DeepObjectValidationError(tuple(path), "Value does not match any allowed condition schema")
+
+
+def _get_oneof_candidates(prop_schema: dict, value_type: type) -> tuple[dict, ...]:
+    """Return the ``oneOf`` branches able to accept a value of the given type, in declaration order."""
+    candidates_by_type = _get_oneof_candidates_by_type(prop_schema)
+
+    if (candidates := candidates_by_type.get(value_type)) is None:
+        candidates = candidates_by_type[value_type] = tuple(
+            branch for branch in prop_schema["oneOf"] if _branch_accepts(branch, value_type)
+        )
 
-            if not matched:
-                raise last_error or DeepObjectValidationError(current_path, "Value does not match any allowed condition schema")
+    return candidates
 
-            continue
 
-        validate_value(value, prop_schema, current_path)
+@cache_by_schema
+def _get_oneof_candidates_by_type(prop_schema: dict) -> dict[type, tuple[dict, ...]]:
+    return {}  # Filled lazily by ``_get_oneof_candidates``, one value type at a time
+
+
+def _branch_accepts(branch: dict, value_type: type) -> bool:
+    branch_type = branch.get("type")
+
+    if branch_type == "object":
+        return issubclass(value_type, dict)
+
+    if issubclass(value_type, dict):
+        return False
+
+    # Unknown branch types stay candidates so they surface as schema definition errors
+    accepted_types = _BRANCH_VALUE_TYPES.get(branch_type)
+
+    if accepted_types is None:
+        return True
+
+    # bool subclasses int, but the integer and number arms reject it
+    if value_type is bool:
+        return branch_type == "boolean"
+
+    return issubclass(value_type, accepted_types)
 
 
 def validate_value(value: Any, schema: dict, path: list[str]) -> None:
@@ -100,44 +178,58 @@ def validate_value(value: Any, schema: dict, path: list[str]) -> None:
             If the value does not conform to the schema definition, including type
             mismatches or format violations.
     """
+    _validate_value(value, schema, list(path))
+
+
+def _validate_value(value: Any, schema: dict, path: list[str]) -> None:
     prop_type = schema.get("type")
     prop_format = schema.get("format")
 
     match prop_type:
         case "object":
             if not isinstance(value, dict):
-                raise DeepObjectValidationError(path, "Expected nested filter object")
+                raise DeepObjectValidationError(tuple(path), "Expected nested filter object")
 
-            validate_filters(value, schema, path)
+            _validate_filters(value, schema, path)
         case "array":
             if not isinstance(value, list):
-                raise DeepObjectValidationError(path, f"Expected array, got {type(value).__name__}")
+                raise DeepObjectValidationError(tuple(path), f"Expected array, got {type(value).__name__}")
 
             items_schema = schema.get("items", {})
 
             for i, item in enumerate(value):
-                validate_value(item, items_schema, path + [str(i)])
+                path.append(str(i))
+                _validate_value(item, items_schema, path)
+                path.pop()
         case "string":
             if not isinstance(value, str):
-                raise DeepObjectValidationError(path, f"Expected string, got {type(value).__name__}")
+                raise DeepObjectValidationError(tuple(path), f"Expected string, got {type(value).__name__}")
 
-            if prop_format == "date-time":
-                try:
-                    datetime.fromisoformat(value.replace("Z", "+00:00"))
-                except ValueError:
-                    raise DeepObjectValidationError(path, f"Expected ISO 8601 date-time string, got '{value}'")
+            if prop_format == "date-time" and not _is_iso_datetime(value):
+                raise DeepObjectValidationError(tuple(path), f"Expected ISO 8601 date-time string, got '{value}'")
         case "integer":
-            if not isinstance(value, int):
-                raise DeepObjectValidationError(path, f"Expected integer, got {type(value).__name__}")
+            if type(value) is not int:
+                raise DeepObjectValidationError(tuple(path), f"Expected integer, got {type(value).__name__}")
         case "number":
-            if not isinstance(value, (int, float)):
-                raise DeepObjectValidationError(path, f"Expected number, got {type(value).__name__}")
+            value_type = type(value)
+            if value_type is not int and value_type is not float:
+                raise DeepObjectValidationError(tuple(path), f"Expected number, got {type(value).__name__}")
         case "boolean":
             if not isinstance(value, bool):
-                raise DeepObjectValidationError(path, f"Expected boolean, got {type(value).__name__}")
+                raise DeepObjectValidationError(tuple(path), f"Expected boolean, got {type(value).__name__}")
         case "null":
             if value is not None:
-                raise DeepObjectValidationError(path, f"Expected null, got {type(value).__name__}")
+                raise DeepObjectValidationError(tuple(path), f"Expected null, got {type(value).__name__}")
         case _:
-            raise DeepObjectValidationError(path, "Invalid filter schema definition")
+            raise DeepObjectValidationError(tuple(path), "Invalid filter schema definition")
+
+
+@lru_cache(maxsize=2048)
+def _is_iso_datetime(value: str) -> bool:
+    """Return whether a string parses as an ISO 8601 date-time, memoized for recurring values."""
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return False
 
+    return True
@@ -1,4 +1,9 @@
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
 from app.exceptions import DeepObjectValidationError
+from ..schema_cache import cache_by_schema
 
 
 def validate_include(
@@ -6,7 +11,7 @@ def validate_include(
     schema: dict,
     path: list[str] = None,
 ):
-    """Recursively validate deep-object include structures.
+    """Validate deep-object include structures.
 
     Enforces:
         - Only declared relationships may be included
@@ -14,73 +19,168 @@ def validate_include(
         - oneOf schema resolution for conditional includes
         - Prevention of forbidden recursive relationships
 
+    A thin wrapper over the same compiled field validators as
+    ``compile_include_validator``, so both enforce one set of rules.
+
     Args:
         include:
             Nested include dictionary from query parameters.
         schema:
             OpenAPI schema describing allowed structure.
         path:
-            Internal recursion path (used for error reporting).
+            Path prefix used for error reporting.
 
     Raises:
         DeepObjectValidationError:
             On invalid structure or value.
     """
-    if path is None:
-        path = []
+    if include:
+        _validate_include_object(include, schema, tuple(path) if path else ())
+
+
+@cache_by_schema
+def _get_oneof_branches(prop: dict) -> tuple[dict | None, dict | None]:
+    """Return the (object, boolean) branches of a ``oneOf`` property, scanning it once per schema.
+
+    If a branch type repeats, the last branch of that type is used.
+    """
+    obj_branch = None
+    bool_branch = None
+
+    for branch in prop["oneOf"]:
+        t = branch.get("type")
+
+        if t == "object":
+            obj_branch = branch
+        elif t == "boolean":
+            bool_branch = branch
+
+    return obj_branch, bool_branch
+
+
+def compile_include_validator(schema: dict) -> Callable[[dict], None]:
+    """Build a specialized validator closure for an include schema.
+
+    Every object schema reached is resolved once into per-field closures (boolean
+    enum checks, ``oneOf`` branch selection, nested objects), cached by schema
+    identity, so the returned validator never re-inspects the schema.
+    ``validate_include`` shares the same compiled fields.
+
+    Args:
+        schema:
+            OpenAPI schema describing allowed structure.
+
+    Returns:
+        A callable raising ``DeepObjectValidationError`` if its argument is not a
+        valid include structure.
+    """
+    _get_include_fields(schema)
+
+    def validate_compiled(include: dict):
+        if include:
+            _validate_include_object(include, schema, ())
+
+    return validate_compiled
+
+
+@cache_by_schema
+def get_include_validator(schema: dict) -> Callable[[dict], None]:
+    """Return the compiled validator for an include schema, compiling it on first use."""
+    return compile_include_validator(schema)
 
+
+def _validate_include_object(include: dict, schema: dict, path: tuple[str, ...]):
+    # Nested objects are walked with an explicit stack rather than recursion, so
+    # deeply nested input cannot exhaust the interpreter's recursion limit
+    stack = [(include, schema, path)]
+
+    while stack:
+        include, schema, path = stack.pop()
+        fields = _get_include_fields(schema)
+
+        for key, value in include.items():
+            if (validate_field := fields.get(key)) is None:
+                raise DeepObjectValidationError((*path, key), "Unknown include field")
+
+            if (nested_schema := validate_field(value, path, key)) is not None:
+                stack.append((value, nested_schema, (*path, key)))
+
+
+@cache_by_schema
+def _get_include_fields(schema: dict) -> Mapping[str, Callable[[Any, tuple[str, ...], str], dict | None]]:
+    """Resolve each property of an include object schema into its field validator.
+
+    A field validator raises on an invalid value and returns the object schema to
+    descend into when the value is a nested include. Nested object schemas are only
+    resolved once the walk reaches them.
+    """
     properties = schema.get("properties", schema)
+    # Interned keys let lookups with already-interned request keys short-circuit on identity
+    return MappingProxyType({sys.intern(key): _compile_include_field(prop) for key, prop in properties.items()})
+
+
+def _compile_include_field(prop: dict) -> Callable[[Any, tuple[str, ...], str], dict | None]:
+    if not isinstance(prop, dict):
+        return _invalid_include_field
+
+    prop_type = prop.get("type")
 
-    for key, value in include.items():
-        current_path = path + [key]
+    if prop_type == "boolean":
+        enum = prop.get("enum")
 
-        if key not in properties:
-            raise DeepObjectValidationError(current_path, "Unknown include field")
+        if enum is None:
+            # Most include fields are plain booleans; skip the enum check entirely for them
+            def validate_plain_boolean(value: Any, path: tuple[str, ...], key: str):
+                if value is not True and value is not False:
+                    raise DeepObjectValidationError((*path, key), "Expected boolean (true or false)")
 
-        prop = properties[key]
-        prop_type = prop.get("type")
+            return validate_plain_boolean
 
-        if prop_type == "boolean":
-            if (enum := prop.get("enum")) is not None and value not in enum:
+        def validate_boolean(value: Any, path: tuple[str, ...], key: str):
+            if value not in enum:
                 # Catch first for better error clarity in the case of the user providing True or a nested include
-                raise DeepObjectValidationError(current_path, "This relationship cannot be included (recursive include is forbidden)")
+                raise DeepObjectValidationError((*path, key), "This relationship cannot be included (recursive include is forbidden)")
 
             if not isinstance(value, bool):
-                raise DeepObjectValidationError(current_path, "Expected boolean (true or false)")
-        elif "oneOf" in prop:
-            obj_branch = None
-            bool_branch = None
+                raise DeepObjectValidationError((*path, key), "Expected boolean (true or false)")
 
-            for branch in prop["oneOf"]:
-                t = branch.get("type")
+        return validate_boolean
 
-                if t == "object":
-                    obj_branch = branch
-                elif t == "boolean":
-                    bool_branch = branch
+    if "oneOf" in prop:
+        obj_branch, bool_branch = _get_oneof_branches(prop)
+        bool_enum = bool_branch.get("enum") if bool_branch is not None else None
 
+        def validate_one_of(value: Any, path: tuple[str, ...], key: str) -> dict | None:
             if isinstance(value, dict):
                 if obj_branch is None:
-                    raise DeepObjectValidationError(current_path, "Nested includes are not allowed here")
+                    raise DeepObjectValidationError((*path, key), "Nested includes are not allowed here")
 
-                validate_include(value, obj_branch, current_path)
-            elif isinstance(value, bool):
+                return obj_branch
+
+            if isinstance(value, bool):
                 if bool_branch is None:
-                    raise DeepObjectValidationError(current_path, "Boolean value not allowed here")
-
-                enum = bool_branch.get("enum")
-
-                if enum is not None and value not in enum:
-                    raise DeepObjectValidationError(current_path, f"This relationship cannot be {"included" if value else "excluded"}")
-            else:
-                raise DeepObjectValidationError(
-                    current_path,
-                    "Expected boolean or object"
-                )
-        elif prop_type == "object":
+                    raise DeepObjectValidationError((*path, key), "Boolean value not allowed here")
+
+                if bool_enum is not None and value not in bool_enum:
+                    raise DeepObjectValidationError((*path, key), f"This relationship cannot be {"included" if value else "excluded"}")
+
+                return None
+
+            raise DeepObjectValidationError((*path, key), "Expected boolean or object")
+
+        return validate_one_of
+
+    if prop_type == "object":
+        def validate_nested_object(value: Any, path: tuple[str, ...], key: str) -> dict:
             if not isinstance(value, dict):
-                raise DeepObjectValidationError(current_path, "Expected nested include object")
+                raise DeepObjectValidationError((*path, key), "Expected nested include object")
+
+            return prop
+
+        return validate_nested_object
+
+    return _invalid_include_field
+
 
-            validate_include(value, prop, current_path)
-        else:
-            raise DeepObjectValidationError(current_path, "Invalid include schema definition")
+def _invalid_include_field(value: Any, path: tuple[str, ...], key: str):
+    raise DeepObjectValidationError((*path, key), "Invalid include schema definition")
@@ -1,4 +1,14 @@
+import sys
+from typing import Any, Callable
+
 from app.exceptions import ArrayValidationError
+from ..schema_cache import cache_by_schema
+
+_SORTING_KEYS = frozenset({"field", "order"})
+
+# Shared {"field", "order"} sorting dicts for every pair a compiled schema allows. Only schema enums
+# populate it, so client input can't grow it. Consumers treat sorting items as read-only.
+_sorting_items: dict[tuple[Any, Any], dict] = {}
 
 
 def validate_sorting(
@@ -12,6 +22,9 @@ def validate_sorting(
         - Uses an allowed `order` (default: ``asc``/``desc``)
         - Does not include unexpected keys
 
+    The schema is compiled once (see ``compile_sorting_validator``) and the compiled
+    validator is reused for subsequent calls with the same schema object.
+
     Args:
         sorting:
             List of sorting dictionaries.
@@ -22,22 +35,80 @@ def validate_sorting(
         ArrayValidationError:
             If any entry fails validation.
     """
-    items_schema = schema.get("items", {})
-    allowed_fields = set(items_schema.get("properties", {}).get("field", {}).get("enum", []))
-    allowed_orders = set(items_schema.get("properties", {}).get("order", {}).get("enum", ["asc", "desc"]))
+    if not sorting:
+        return
+
+    _get_sorting_validator(schema)(sorting)
+
+
+def intern_sorting_item(item: Any) -> Any:
+    """Return the shared dict for an allowed ``{"field": ..., "order": ...}`` sorting item.
+
+    Items that aren't a field/order pair from an already compiled sorting schema are returned
+    unchanged.
+
+    Args:
+        item:
+            Parsed sorting item.
+
+    Returns:
+        The shared dict equal to ``item``, or ``item`` itself.
+    """
+    if type(item) is not dict or len(item) != 2:
+        return item
+
+    key = (item.get("field"), item.get("order"))
+
+    try:
+        return _sorting_items.get(key, item)
+    except TypeError:  # Unhashable field or order
+        return item
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+@cache_by_schema
+def _get_sorting_validator(schema: dict) -> Callable[[list], None]:
+    return compile_sorting_validator(schema)
+
+
+def compile_sorting_validator(schema: dict) -> Callable[[list], None]:
+    """Build a specialized validator closure for a sorting schema.
+
+    The allowed fields and orders are resolved into frozensets once, so the returned
+    validator never re-inspects the schema.
+
+    Args:
+        schema:
+            OpenAPI schema defining allowed fields and orders.
+
+    Returns:
+        A callable raising ``ArrayValidationError`` if its argument is not a valid
+        list of sorting directives.
+    """
+    properties = schema.get("items", {}).get("properties", {})
+    allowed_fields = frozenset(map(_intern, properties.get("field", {}).get("enum", [])))
+    allowed_orders = frozenset(map(_intern, properties.get("order", {}).get("enum", ["asc", "desc"])))
+
+    for field in allowed_fields:
+        for order in allowed_orders:
+            _sorting_items.setdefault((field, order), {"field": field, "order": order})
 
-    for i, item in enumerate(sorting):
-        field = item.get("field")
+    def validate_compiled(sorting: list):
+        for i, item in enumerate(sorting):
+            field = item.get("field")
 
-        if not field or field not in allowed_fields:
-            raise ArrayValidationError(i, f"Field '{field}' not in {allowed_fields}")
+            if not field or field not in allowed_fields:
+                raise ArrayValidationError(i, f"Field '{field}' not in {set(allowed_fields)}")
 
-        order = item.get("order", "asc")
+            order = item.get("order", "asc")
 
-        if order not in allowed_orders:
-            raise ArrayValidationError(i, f"Order '{order}' not in {allowed_orders}")
+            if order not in allowed_orders:
+                raise ArrayValidationError(i, f"Order '{order}' not in {set(allowed_orders)}")
 
-        extra_keys = set(item.keys()) - {"field", "order"}
+            if not item.keys() <= _SORTING_KEYS:
+                raise ArrayValidationError(i, f"Unexpected key(s) provided: {set(item.keys()) - _SORTING_KEYS}")
 
-        if extra_keys:
-            raise ArrayValidationError(i, f"Unexpected key(s) provided: {extra_keys}")
+    return validate_compiled
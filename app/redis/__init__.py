@@ -12,6 +12,9 @@ __all__ = [
     "LOCK_EXPIRY",
     "LOCK_ACQUISITION_TIMEOUT",
     "LOCK_ACQUISITION_RETRY_INTERVAL",
+    "LOCK_ACQUISITION_MAX_RETRY_INTERVAL",
     "CACHED_BEATMAP_EXPIRY",
     "CACHED_BEATMAPSET_EXPIRY",
+    "SCAN_MIN_BATCH_COUNT",
+    "SCAN_MAX_BATCH_COUNT",
 ]
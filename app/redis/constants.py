@@ -1,5 +1,8 @@
 LOCK_EXPIRY = 10
 LOCK_ACQUISITION_TIMEOUT = 10
 LOCK_ACQUISITION_RETRY_INTERVAL = 1
+LOCK_ACQUISITION_MAX_RETRY_INTERVAL = 4
 CACHED_BEATMAP_EXPIRY = 3600
 CACHED_BEATMAPSET_EXPIRY = 3600
+SCAN_MIN_BATCH_COUNT = 1000
+SCAN_MAX_BATCH_COUNT = 10_000
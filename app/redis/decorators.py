@@ -1,12 +1,12 @@
 import asyncio
 import inspect
+import time
 from typing import Callable, Awaitable, ParamSpec, TypeVar, runtime_checkable, Protocol
 from functools import wraps
-from datetime import timedelta
+from datetime import datetime, timezone
 
 from app.exceptions import RateLimitExceededError
 from app.logging import get_logger
-from app.utils import aware_utcnow
 from .rc import RedisClient
 from .enums import Namespace
 from app.observability.metrics.rate_limit import (
@@ -80,6 +80,10 @@ def rate_limit(
         if not inspect.iscoroutinefunction(func):
             raise ValueError(f"Function '{func.__name__}' must be async to use @rate_limit")
 
+        # Counter key of the most recently seen window; it only changes when a new window starts
+        cached_window_start: int | None = None
+        cached_counter_hash_name: str | None = None
+
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             obj = args[0] if args else None
@@ -96,7 +100,8 @@ def rate_limit(
                 raise ValueError(f"First argument of '{func.__name__}' must be either an instance of {RedisClient.__name__}, an object that contains a 'rc' attribute, or a Redis-like object with 'incr' and 'expire' methods")
 
             async def sub_wrapper() -> T:
-                now = aware_utcnow()
+                nonlocal cached_window_start, cached_counter_hash_name
+                now = time.time()
                 endpoint = func.__name__
 
                 # --- min_interval gate ---
@@ -105,24 +110,30 @@ def rate_limit(
                     last_ts_raw = await rc.get(last_call_key)
                     if last_ts_raw is not None:
                         last_ts = float(last_ts_raw)
-                        elapsed = (now.timestamp() - last_ts)
+                        elapsed = (now - last_ts)
                         if elapsed < min_interval:
                             sleep_for = min_interval - elapsed
                             logger.debug(
-                                f"Rate limit min_interval: sleeping {sleep_for:.2f}s "
-                                f"(last call {last_ts}, now {now.timestamp()})"
+                                "Rate limit min_interval: sleeping %.2fs (last call %s, now %s)",
+                                sleep_for, last_ts, now
                             )
                             await asyncio.sleep(sleep_for)
-                            now = aware_utcnow()
+                            now = time.time()
 
-                    await rc.set(last_call_key, str(now.timestamp()), ex=int(window_size))
+                    await rc.set(last_call_key, str(now), ex=int(window_size))
 
                 # --- window counter gate ---
                 if limit_per_window > 0:
-                    window_start = now.replace(second=0, microsecond=0)
-                    window_end = window_start + timedelta(seconds=window_size)
-                    window_delta_seconds = int((window_end - now).total_seconds() + 1)
-                    counter_hash_name = Namespace.RATE_LIMIT_COUNTER.hash_name(int(window_start.timestamp()))
+                    # Windows start on the minute; plain epoch arithmetic avoids building datetimes per call
+                    window_start = int(now) - int(now) % 60
+                    window_end = window_start + window_size
+                    window_delta_seconds = int(window_end - now + 1)
+
+                    if window_start != cached_window_start:
+                        cached_window_start = window_start
+                        cached_counter_hash_name = Namespace.RATE_LIMIT_COUNTER.hash_name(window_start)
+
+                    counter_hash_name = cached_counter_hash_name
 
                     current_count = await rc.incr(counter_hash_name)
                     if current_count == 1:
@@ -133,14 +144,13 @@ def rate_limit(
 
                         if not auto_retry:
                             raise RateLimitExceededError(
-                                next_window=window_end,
-                                last_call_timestamp=now.timestamp(),
+                                next_window=datetime.fromtimestamp(window_end, timezone.utc),
+                                last_call_timestamp=now,
                             )
 
                         logger.info(
-                            f"Rate limit window exceeded for {func.__name__}: "
-                            f"{current_count}/{limit_per_window} calls in window, "
-                            f"retrying in {window_delta_seconds}s"
+                            "Rate limit window exceeded for %s: %s/%s calls in window, retrying in %ss",
+                            endpoint, current_count, limit_per_window, window_delta_seconds
                         )
                         rate_limit_retries_total.labels(endpoint=endpoint).inc()
                         await asyncio.sleep(window_delta_seconds)
@@ -1,7 +1,25 @@
-from ast import literal_eval
-from datetime import datetime
+import json
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from app.database.schemas.sub_schemas import BeatmapOsuApiSchema
+from .utils import parse_datetime
+
+_JSON_FIELDS = frozenset({"is_scoreable", "failtimes", "owners", "top_tag_ids"})  # Bools and containers
+
+# Converter per non-string field; an empty string always deserializes to None
+_FIELD_DESERIALIZERS: Mapping[str, Callable[[str], Any]] = MappingProxyType({
+    **dict.fromkeys(
+        (
+            "id", "user_id", "count_circles", "count_sliders", "count_spinners", "hit_length", "max_combo",
+            "mode_int", "passcount", "playcount", "ranked", "total_length"
+        ),
+        int
+    ),
+    **dict.fromkeys(("accuracy", "ar", "bpm", "cs", "difficulty_rating", "drain"), float),
+    **dict.fromkeys(_JSON_FIELDS, json.loads),
+    **dict.fromkeys(("deleted_at", "last_updated"), parse_datetime),
+})
 
 
 class Beatmap(BeatmapOsuApiSchema):
@@ -9,22 +27,23 @@ class Beatmap(BeatmapOsuApiSchema):
     def serialize(self) -> dict[str, str]:
         """Serialize the beatmap into a Redis-safe string dictionary.
 
+        The model is dumped to JSON-compatible values in a single pass; bools and containers
+        are then JSON-encoded and everything else is stringified.
+
         Returns:
             A dictionary with stringified values.
         """
         serialized_dict = {}
 
-        for key, value in self.__dict__.items():
-            match key:
-                case "deleted_at" | "last_updated":
-                    value = value.isoformat() if value is not None else ""
-                case "failtimes":
-                    if isinstance(value, list):
-                        value = [item.model_dump(mode="json") for item in value]
-                    elif value is not None:
-                        value = value.model_dump(mode="json")
+        for key, value in self.model_dump(mode="json").items():
+            if value is None:
+                value = ""
+            elif key in _JSON_FIELDS:
+                value = json.dumps(value)
+            elif type(value) is not str:
+                value = str(value)
 
-            serialized_dict[key] = str(value) if value is not None else ""
+            serialized_dict[key] = value
 
         return serialized_dict
 
@@ -42,18 +61,8 @@ class Beatmap(BeatmapOsuApiSchema):
         deserialized_dict = {}
 
         for key, value in serialized_dict.items():
-            match key:
-                case "id" | "user_id" | "count_circles" | "count_sliders" | "count_spinners" | "hit_length" | "max_combo" | "mode_int" | "passcount" | "playcount" | "ranked" | "total_length":
-                    value = int(value) if value != "" else None
-                case "accuracy" | "ar" | "bpm" | "cs" | "difficulty_rating" | "drain":
-                    value = float(value) if value != "" else None
-                case (
-                    "is_scoreable" |  # Bools
-                    "failtimes" | "owners" | "top_tag_ids"  # Lists
-                ):
-                    value = literal_eval(value) if value != "" else None
-                case "deleted_at" | "last_updated":
-                    value = datetime.fromisoformat(value) if value != "" else None
+            if (deserializer := _FIELD_DESERIALIZERS.get(key)) is not None:
+                value = deserializer(value) if value != "" else None
 
             deserialized_dict[key] = value
 
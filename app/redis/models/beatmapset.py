@@ -1,8 +1,25 @@
-from ast import literal_eval
-from datetime import datetime
+import json
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from app.database.schemas.sub_schemas import BeatmapsetOsuApiSchema
 from .beatmap import Beatmap
+from .utils import parse_datetime
+
+_JSON_FIELDS = frozenset({
+    "verified", "nsfw", "video", "is_scoreable", "spotlight", "discussion_enabled", "discussion_locked", "can_be_hyped", "storyboard",  # Bools
+    "availability", "description", "nominations_summary", "user", "covers", "genre", "hype", "language",  # Dicts
+    "pack_tags", "current_nominations", "ratings",  # Lists
+    "beatmaps"  # Plain JSON objects, validated into ``Beatmap`` by ``model_validate``
+})
+
+# Converter per non-string field; an empty string always deserializes to None
+_FIELD_DESERIALIZERS: Mapping[str, Callable[[str], Any]] = MappingProxyType({
+    **dict.fromkeys(("id", "user_id", "favourite_count", "offset", "play_count", "ranked", "track_id"), int),
+    **dict.fromkeys(("bpm", "rating"), float),
+    **dict.fromkeys(_JSON_FIELDS, json.loads),
+    **dict.fromkeys(("deleted_at", "last_updated", "submitted_date", "ranked_date"), parse_datetime),
+})
 
 
 class Beatmapset(BeatmapsetOsuApiSchema):
@@ -12,24 +29,24 @@ class Beatmapset(BeatmapsetOsuApiSchema):
     def serialize(self) -> dict[str, str]:
         """Serialize the beatmapset into a Redis-safe string dictionary.
 
+        The model, including its beatmaps, is dumped to JSON-compatible values in a single
+        pass; bools, nested schemas, containers and the beatmaps list are then JSON-encoded
+        and everything else is stringified.
+
         Returns:
             A dictionary with stringified values.
         """
         serialized_dict = {}
 
-        for key, value in self.__dict__.items():
-            match key:
-                case "deleted_at" | "last_updated" | "submitted_date" | "ranked_date":
-                    value = value.isoformat() if value is not None else ""
-                case "beatmaps":
-                    value = [beatmap.serialize() for beatmap in value]
-                case "availability" | "covers" | "current_nominations" | "description" | "genre" | "hype" | "language" | "nominations_summary":
-                    if isinstance(value, list):
-                        value = [item.model_dump(mode="json") for item in value]
-                    elif value is not None:
-                        value = value.model_dump(mode="json")
+        for key, value in self.model_dump(mode="json").items():
+            if value is None:
+                value = ""
+            elif key in _JSON_FIELDS:
+                value = json.dumps(value)
+            elif type(value) is not str:
+                value = str(value)
 
-            serialized_dict[key] = str(value) if value is not None else ""
+            serialized_dict[key] = value
 
         return serialized_dict
 
@@ -47,21 +64,8 @@ class Beatmapset(BeatmapsetOsuApiSchema):
         deserialized_dict = {}
 
         for key, value in serialized_dict.items():
-            match key:
-                case "id" | "user_id" | "favourite_count" | "offset" | "play_count" | "ranked" | "track_id":
-                    value = int(value) if value != "" else None
-                case "bpm" | "rating":
-                    value = float(value) if value != "" else None
-                case (
-                    "verified" | "nsfw" | "video" | "is_scoreable" | "spotlight" | "discussion_enabled" | "discussion_locked" | "can_be_hyped" | "storyboard" |  # Bools
-                    "availability" | "description" | "nominations_summary" | "user" | "covers" | "genre" | "hype" | "language" |  # Dicts
-                    "pack_tags" | "current_nominations" | "ratings"  # Lists
-                ):
-                    value = literal_eval(value) if value != "" else None
-                case "deleted_at" | "last_updated" | "submitted_date" | "ranked_date":
-                    value = datetime.fromisoformat(value) if value != "" else None
-                case "beatmaps":
-                    value = [Beatmap.deserialize(beatmap) for beatmap in literal_eval(value)]
+            if (deserializer := _FIELD_DESERIALIZERS.get(key)) is not None:
+                value = deserializer(value) if value != "" else None
 
             deserialized_dict[key] = value
 
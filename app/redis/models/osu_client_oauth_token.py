@@ -17,7 +17,7 @@ class OsuClientOAuthToken(BaseModel):
         serialized_dict = {}
 
         for key, value in self.__dict__.items():
-            serialized_dict[key] = str(value)
+            serialized_dict[key] = value if type(value) is str else str(value)
 
         return serialized_dict
 
@@ -1,10 +1,17 @@
-from ast import literal_eval
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from pydantic.main import BaseModel
 from pydantic.fields import computed_field
 
+from .utils import parse_datetime
+
+# ``serialize`` stores bools via ``str()``; anything else is left for pydantic to validate
+_BOOL_LITERALS: Mapping[str, bool] = MappingProxyType({"True": True, "False": False})
+
+_DATETIME_FIELDS = frozenset({"completed_at", "failed_at"})
+
 
 class QueueRequestHandlerTask(BaseModel):
     """Represents a queued beatmapset request processing task."""
@@ -25,7 +32,7 @@ class QueueRequestHandlerTask(BaseModel):
         Returns:
             A 64-bit positive integer hash.
         """
-        return hash((self.queue_id, self.beatmapset_id)) & 0x7FFFFFFFFFFFFFFF
+        return hash((self.queue_id, self.beatmapset_id)) & 0x7FFFFFFFFFFFFFFF  # Int tuples hash the same in every process
 
     def serialize(self) -> dict[str, str]:
         """Serialize the task for Redis storage.
@@ -36,11 +43,12 @@ class QueueRequestHandlerTask(BaseModel):
         serialized_dict = {}
 
         for key, value in self.__dict__.items():
-            match key:
-                case "completed_at" | "failed_at":
-                    value = value.isoformat() if value is not None else ""
+            if key in _DATETIME_FIELDS:
+                value = value.isoformat() if value is not None else ""
+            elif type(value) is not str:
+                value = str(value)
 
-            serialized_dict[key] = str(value)
+            serialized_dict[key] = value
 
         return serialized_dict
 
@@ -62,9 +70,9 @@ class QueueRequestHandlerTask(BaseModel):
                 case "user_id" | "beatmapset_id" | "queue_id":
                     value = int(value)
                 case "mv_checked":
-                    value = literal_eval(value)
+                    value = _BOOL_LITERALS.get(value, value)
                 case "completed_at" | "failed_at":
-                    value = datetime.fromisoformat(value) if value else None
+                    value = parse_datetime(value) if value else None
 
             deserialized_dict[key] = value
 
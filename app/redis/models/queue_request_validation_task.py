@@ -1,10 +1,14 @@
-from ast import literal_eval
 from datetime import datetime
 from typing import Optional
 
 from pydantic.main import BaseModel
 from pydantic.fields import computed_field
 
+from app.utils import stable_hash
+from .utils import parse_datetime
+
+_DATETIME_FIELDS = frozenset({"completed_at", "failed_at"})
+
 
 class QueueRequestValidationTask(BaseModel):
     """Represents a queued request validation task for Tier 3 validators."""
@@ -19,17 +23,18 @@ class QueueRequestValidationTask(BaseModel):
     @computed_field
     @property
     def hashed_id(self) -> int:
-        return hash(("validation", self.request_id)) & 0x7FFFFFFFFFFFFFFF
+        return stable_hash("validation", self.request_id)
 
     def serialize(self) -> dict[str, str]:
         serialized_dict = {}
 
         for key, value in self.__dict__.items():
-            match key:
-                case "completed_at" | "failed_at":
-                    value = value.isoformat() if value is not None else ""
+            if key in _DATETIME_FIELDS:
+                value = value.isoformat() if value is not None else ""
+            elif type(value) is not str:
+                value = str(value)
 
-            serialized_dict[key] = str(value)
+            serialized_dict[key] = value
 
         return serialized_dict
 
@@ -42,7 +47,7 @@ class QueueRequestValidationTask(BaseModel):
                 case "request_id" | "queue_id" | "beatmapset_id":
                     value = int(value)
                 case "completed_at" | "failed_at":
-                    value = datetime.fromisoformat(value) if value else None
+                    value = parse_datetime(value) if value else None
 
             deserialized_dict[key] = value
 
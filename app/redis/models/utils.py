@@ -0,0 +1,15 @@
+import sys
+from datetime import datetime
+
+__all__ = [
+    "parse_datetime"
+]
+
+try:
+    from ciso8601 import parse_datetime  # Optional C parser, used when installed
+except ImportError:
+    if sys.version_info >= (3, 11):
+        parse_datetime = datetime.fromisoformat  # Accepts a trailing "Z" natively
+    else:
+        def parse_datetime(value: str) -> datetime:
+            return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
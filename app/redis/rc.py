@@ -10,7 +10,14 @@ from redis.asyncio import Redis as AsyncRedis
 from app.config import REDIS_CONFIGURATION
 from app.exceptions import RedisLockTimeoutError
 from app.logging import get_logger
-from .constants import LOCK_EXPIRY, LOCK_ACQUISITION_RETRY_INTERVAL, LOCK_ACQUISITION_TIMEOUT
+from .constants import (
+    LOCK_EXPIRY,
+    LOCK_ACQUISITION_RETRY_INTERVAL,
+    LOCK_ACQUISITION_MAX_RETRY_INTERVAL,
+    LOCK_ACQUISITION_TIMEOUT,
+    SCAN_MIN_BATCH_COUNT,
+    SCAN_MAX_BATCH_COUNT
+)
 from app.observability.metrics.redis import (
     redis_commands_total,
     redis_commands_duration_seconds,
@@ -26,6 +33,17 @@ __all__ = [
 REDIS_BASE_URL = f"redis://{REDIS_CONFIGURATION["username"]}:***@{REDIS_CONFIGURATION["host"]}:{REDIS_CONFIGURATION["port"]}/{REDIS_CONFIGURATION["db"]}"
 logger = get_logger(__name__)
 
+# Deletes the lock only if the caller still owns it, and wakes any waiters subscribed to ARGV[2]
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    local deleted = redis.call("del", KEYS[1])
+    redis.call("publish", ARGV[2], "1")
+    return deleted
+else
+    return 0
+end
+"""
+
 
 class RedisClient(AsyncRedis):
     """Asynchronous Redis client interface.
@@ -68,8 +86,10 @@ class RedisClient(AsyncRedis):
     ) -> list[str]:
         """Scan keys matching a pattern with offset/limit pagination.
 
-        Uses Redis SCAN with a batch count to minimize round trips. Offset filtering
-        is performed in Python since Redis SCAN does not support server-side offset.
+        Drives the SCAN cursor directly with a large batch count so deep offsets take few
+        round trips. The count hint is capped at ``SCAN_MAX_BATCH_COUNT`` so a single call
+        never blocks Redis on an arbitrarily large client-supplied offset. Offset filtering is performed in Python since Redis SCAN does not support
+        server-side offset; skipped keys are dropped a whole batch at a time.
 
         Args:
             pattern:
@@ -77,25 +97,36 @@ class RedisClient(AsyncRedis):
             limit:
                 Maximum number of keys to return.
             offset:
-                Number of matching keys to skip.
+                Number of matching keys to skip. ``None`` is treated as 0.
             type_:
                 Optional Redis type filter.
 
         Returns:
             A list of matching Redis keys.
         """
+        offset = offset or 0
         keys = []
-        scanned = 0
-        scan_count = max(limit or 100, 100)
+        to_skip = offset
+        scan_count = min(max((limit or 0) + offset, SCAN_MIN_BATCH_COUNT), SCAN_MAX_BATCH_COUNT)
+        cursor = 0
+
+        while True:
+            cursor, batch = await self.scan(cursor, match=pattern, count=scan_count, _type=type_)
+
+            if to_skip:
+                skipped = min(to_skip, len(batch))
+                batch = batch[skipped:]
+                to_skip -= skipped
 
-        async for key in self.scan_iter(match=pattern, _type=type_, count=scan_count):
-            if scanned < offset:
-                scanned += 1
-                continue
+            if limit is not None:
+                keys.extend(batch[:limit - len(keys)])
 
-            keys.append(key)
+                if len(keys) >= limit:
+                    break
+            else:
+                keys.extend(batch)
 
-            if limit is not None and len(keys) >= limit:
+            if cursor == 0:
                 break
 
         return keys
@@ -110,7 +141,10 @@ class RedisClient(AsyncRedis):
     ) -> AsyncIterator[None]:
         """Acquire a distributed lock using Redis SET NX semantics.
 
-        Retries until acquired or timeout is reached. Automatically releases the lock on
+        If the lock is held, waits on a per-lock release channel so the lock is handed over
+        as soon as its owner releases it. Each wait is bounded by a backoff interval that
+        starts at ``retry_interval`` and grows up to ``LOCK_ACQUISITION_MAX_RETRY_INTERVAL``,
+        so locks freed by expiry are still picked up. Automatically releases the lock on
         context exit, but only if it still owns the lock.
 
         Args:
@@ -121,7 +155,7 @@ class RedisClient(AsyncRedis):
             timeout:
                 Maximum time to wait for acquisition.
             retry_interval:
-                Delay between retry attempts.
+                Initial delay between retry attempts.
 
         Yields:
             ``None``.
@@ -131,29 +165,44 @@ class RedisClient(AsyncRedis):
                 If the lock cannot be acquired in time.
         """
         token = secrets.token_urlsafe()
+        release_channel = f"{key}:released"
+
+        if not await self.set(key, token, ex=expiry, nx=True):
+            await self._wait_for_lock(key, token, release_channel, expiry, timeout, retry_interval)
+
+        try:
+            yield
+        finally:
+            await self.eval(_RELEASE_LOCK_SCRIPT, 1, key, token, release_channel)
+
+    async def _wait_for_lock(
+        self,
+        key: str,
+        token: str,
+        release_channel: str,
+        expiry: int,
+        timeout: float,
+        retry_interval: float
+    ):
         loop = asyncio.get_running_loop()
         deadline = loop.time() + timeout
+        wait = retry_interval
 
-        while True:
-            if await self.set(key, token, ex=expiry, nx=True):
-                break
+        async with self.pubsub() as pubsub:
+            await pubsub.subscribe(release_channel)
 
-            if loop.time() > deadline:
-                raise RedisLockTimeoutError(key, timeout)
+            while True:
+                # Retry after subscribing so a release published in between is not missed
+                if await self.set(key, token, ex=expiry, nx=True):
+                    return
 
-            await asyncio.sleep(retry_interval)
+                remaining = deadline - loop.time()
 
-        try:
-            yield
-        finally:
-            lua = """
-            if redis.call("get", KEYS[1]) == ARGV[1] then
-                return redis.call("del", KEYS[1])
-            else
-                return 0
-            end
-            """
-            await self.eval(lua, 1, key, token)
+                if remaining <= 0:
+                    raise RedisLockTimeoutError(key, timeout)
+
+                await pubsub.get_message(ignore_subscribe_messages=True, timeout=min(wait, remaining))
+                wait = min(wait * 1.5, LOCK_ACQUISITION_MAX_RETRY_INTERVAL)
 
 
 @contextmanager
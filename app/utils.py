@@ -39,6 +39,17 @@ def combine_checksums(checksums: list[str]) -> str:
     return combined_hash.hexdigest()
 
 
+def stable_hash(*parts: int | str) -> int:
+    """Hash the given parts into a positive 64-bit integer.
+
+    Unlike the builtin ``hash``, the result does not depend on the interpreter's hash seed,
+    so every process derives the same value for the same parts.
+    """
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=8).digest()
+
+    return int.from_bytes(digest, "big") & 0x7FFFFFFFFFFFFFFF
+
+
 async def stream_file(file: BytesIO, chunk_size: int = 1024):
     file.seek(0)
 
@@ -75,3 +75,13 @@ class TestScoreFetcher:
         result = await service._score_is_submittable(score)
 
         assert result is False
+
+    async def test_on_stopped_closes_osu_api_client(self, service):
+        """Test that stopping the service closes the osu! API client."""
+        service._pubsub = MagicMock(close=AsyncMock())
+        service._oac = MagicMock(close=AsyncMock())
+
+        await service._on_stopped()
+
+        service._pubsub.close.assert_awaited_once()
+        service._oac.close.assert_awaited_once()
@@ -6,7 +6,7 @@ from app.database.utils import (
     validate_type,
     get_filter_condition
 )
-from app.exceptions import TypeValidationError
+from app.exceptions import TypeValidationError, TupleLengthValidationError
 from app.database.enums import FilterOperator
 
 
@@ -140,6 +140,28 @@ class TestValidateType:
         with pytest.raises(TypeValidationError):
             validate_type(Union[int, str], 3.14)
 
+    def test_rejects_tuple_of_wrong_length(self):
+        from typing import Tuple
+        with pytest.raises(TypeValidationError):
+            validate_type(Tuple[int, str], (42, "hello", "extra"))
+
+    def test_tuple_length_error_reports_lengths(self):
+        from typing import Tuple
+        with pytest.raises(TupleLengthValidationError) as exc_info:
+            validate_type(Tuple[int, str], (42, "hello", "extra"))
+
+        assert str(exc_info.value) == "Expected tuple of length 2, but got length 3"
+
+    def test_validates_variadic_tuple(self):
+        from typing import Tuple
+        validate_type(Tuple[int, ...], (1, 2, 3))
+
+    def test_reuses_compiled_validator_per_annotation(self):
+        from typing import List
+        from app.database.utils import _compile_validator
+
+        assert _compile_validator(List[int]) is _compile_validator(List[int])
+
 
 class TestGetFilterCondition:
     def test_eq_operator_on_column(self, db_session):
@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from app.observability.logging import get_logger, setup_logging
+
+
+class TestGetLogger:
+    """Test get_logger proxy reuse."""
+
+    def test_reuses_logger_for_same_name_and_values(self):
+        """Test that repeated calls with the same arguments share one logger."""
+        assert get_logger("tests.reuse", prefix="A") is get_logger("tests.reuse", prefix="A")
+
+    def test_distinct_initial_values_get_distinct_loggers(self):
+        """Test that differing initial values are not conflated."""
+        assert get_logger("tests.distinct", prefix="A") is not get_logger("tests.distinct", prefix="B")
+
+    def test_unhashable_initial_values_are_supported(self):
+        """Test that unhashable initial values fall back to an uncached logger."""
+        logger = get_logger("tests.unhashable", tags=["a", "b"])
+
+        assert logger is not get_logger("tests.unhashable", tags=["a", "b"])
+
+    def test_setup_logging_drops_cached_loggers(self):
+        """Test that reconfiguring logging hands out fresh logger proxies."""
+        logger = get_logger("tests.reconfigure")
+
+        with patch("app.observability.logging.structlog.configure"), \
+                patch("app.observability.logging._configure_stdlib_bridge"):
+            setup_logging()
+
+        assert get_logger("tests.reconfigure") is not logger
@@ -0,0 +1,87 @@
+import logging
+
+from app.observability.logging import _RotatingFileHandler
+
+
+def _make_record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestRotatingFileHandler:
+    """Test _RotatingFileHandler rollover and flushing behavior."""
+
+    def test_no_rollover_below_max_bytes(self, tmp_path):
+        """Test that a file under maxBytes is not rolled over."""
+        handler = _RotatingFileHandler(tmp_path / "app.jsonl", maxBytes=1024, backupCount=1)
+        try:
+            handler.emit(_make_record("short"))
+            assert handler.shouldRollover(_make_record("short")) is False
+        finally:
+            handler.close()
+
+    def test_rollover_once_max_bytes_reached(self, tmp_path):
+        """Test that reaching maxBytes triggers a rollover into a backup file."""
+        handler = _RotatingFileHandler(tmp_path / "app.jsonl", maxBytes=32, backupCount=1)
+        try:
+            for _ in range(3):
+                handler.emit(_make_record("x" * 20))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "app.jsonl.1").exists()
+
+    def test_never_rolls_over_when_max_bytes_disabled(self, tmp_path):
+        """Test that maxBytes=0 disables rollover entirely."""
+        handler = _RotatingFileHandler(tmp_path / "app.jsonl", maxBytes=0, backupCount=1)
+        try:
+            handler.emit(_make_record("x" * 100))
+            assert handler.shouldRollover(_make_record("x")) is False
+        finally:
+            handler.close()
+
+    def test_buffers_records_below_flush_level(self, tmp_path):
+        """Test that records below flush_level stay buffered until flushed."""
+        log_file = tmp_path / "app.jsonl"
+        handler = _RotatingFileHandler(log_file, maxBytes=1024, backupCount=1, flush_interval=60)
+        try:
+            handler.emit(_make_record("buffered"))
+            assert log_file.read_text() == ""
+
+            handler.flush()
+            assert log_file.read_text() == "buffered\n"
+        finally:
+            handler.close()
+
+    def test_flushes_immediately_at_flush_level(self, tmp_path):
+        """Test that a record at flush_level is written through straight away."""
+        log_file = tmp_path / "app.jsonl"
+        handler = _RotatingFileHandler(log_file, maxBytes=1024, backupCount=1, flush_interval=60)
+        try:
+            record = _make_record("boom")
+            record.levelno = logging.ERROR
+            handler.emit(record)
+
+            assert log_file.read_text() == "boom\n"
+        finally:
+            handler.close()
+
+    def test_close_writes_buffered_records(self, tmp_path):
+        """Test that closing the handler flushes anything still buffered."""
+        log_file = tmp_path / "app.jsonl"
+        handler = _RotatingFileHandler(log_file, maxBytes=1024, backupCount=1, flush_interval=60)
+        handler.emit(_make_record("pending"))
+        handler.close()
+
+        assert log_file.read_text() == "pending\n"
+
+    def test_tracks_encoded_size_of_non_ascii_records(self, tmp_path):
+        """Test that the tracked size counts bytes, not characters."""
+        log_file = tmp_path / "app.jsonl"
+        handler = _RotatingFileHandler(log_file, maxBytes=1024, backupCount=1, encoding="utf-8")
+        try:
+            handler.emit(_make_record("ビートマップ"))
+            handler.flush()
+
+            assert handler._stream_size == log_file.stat().st_size == len("ビートマップ\n".encode("utf-8"))
+        finally:
+            handler.close()
@@ -22,6 +22,12 @@ def api_client():
     mock_redis.hset = AsyncMock(return_value=None)
     mock_redis.expire = AsyncMock(return_value=None)
     mock_redis.incr = AsyncMock(return_value=1)
+
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute = AsyncMock(return_value=[])
+    mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+    mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+    mock_redis.pipeline = MagicMock(return_value=mock_pipeline)
     
     class MockLockCtx:
         async def __aenter__(self):
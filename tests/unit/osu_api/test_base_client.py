@@ -195,12 +195,52 @@ async def test_get_auth_headers_with_custom_token(mock_redis_client):
 
 
 @pytest.mark.asyncio
-async def test_format_query_parameters(mock_redis_client):
+async def test_get_auth_headers_uses_fresh_in_memory_token(mock_redis_client):
     from app.osu_api.client.base import OsuAPIClientBase
-    
+    from app.redis.models import OsuClientOAuthToken
+
     client = OsuAPIClientBase(mock_redis_client)
-    
-    params = {"page": 1, "limit": 50, "mode": "osu"}
-    query_string = client.format_query_parameters(params)
-    
-    assert query_string == "?page=1&limit=50&mode=osu"
+    client.get_token = AsyncMock(side_effect=Exception("Should not be called"))
+    client._token = OsuClientOAuthToken(
+        access_token="first_token",
+        token_type="Bearer",
+        expires_in=3600,
+        expires_at=int(time.time()) + 3600
+    )
+
+    assert await client.get_auth_headers() == {"Authorization": "Bearer first_token"}
+
+    client._token = client._token.model_copy(update={"access_token": "second_token"})
+
+    assert await client.get_auth_headers() == {"Authorization": "Bearer second_token"}
+
+
+@pytest.mark.asyncio
+async def test_get_auth_headers_refreshes_expired_token(mock_redis_client):
+    from app.osu_api.client.base import OsuAPIClientBase
+    from app.redis.models import OsuClientOAuthToken
+
+    client = OsuAPIClientBase(mock_redis_client)
+    client._token = OsuClientOAuthToken(
+        access_token="expired_token",
+        token_type="Bearer",
+        expires_in=3600,
+        expires_at=int(time.time()) - 10
+    )
+    fresh_token = OsuClientOAuthToken(
+        access_token="fresh_token",
+        token_type="Bearer",
+        expires_in=3600,
+        expires_at=int(time.time()) + 3600
+    )
+
+    async def mock_get_token():
+        client._token = fresh_token
+        return fresh_token.access_token
+
+    client.get_token = AsyncMock(side_effect=mock_get_token)
+
+    headers = await client.get_auth_headers()
+
+    assert headers == {"Authorization": "Bearer fresh_token"}
+    client.get_token.assert_awaited_once()
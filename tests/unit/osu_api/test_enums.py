@@ -0,0 +1,30 @@
+from app.osu_api.enums import APIEndpoint, ScoreType, Ruleset, API_BASEURL
+
+
+class TestAPIEndpointFormat:
+    """Test APIEndpoint URL formatting."""
+
+    def test_formats_keyword_arguments(self):
+        """Test that placeholders are filled from keyword arguments."""
+        assert APIEndpoint.BEATMAP.format(beatmap=123) == f"{API_BASEURL}/beatmaps/123"
+
+    def test_none_is_blanked_and_trailing_slash_stripped(self):
+        """Test that None values render empty and leave no trailing slash."""
+        assert APIEndpoint.USER.format(user=42, mode=None) == f"{API_BASEURL}/users/42"
+
+    def test_empty_string_strips_trailing_slash(self):
+        """Test that empty placeholders at the end leave no trailing slash."""
+        assert APIEndpoint.USER.format(user=42, mode="") == f"{API_BASEURL}/users/42"
+
+    def test_none_positional_argument_is_blanked(self):
+        """Test that None positional arguments render empty as well."""
+        assert APIEndpoint.BEATMAP.format(None, beatmap=7) == f"{API_BASEURL}/beatmaps/7"
+
+    def test_endpoint_without_placeholders(self):
+        """Test formatting an endpoint that takes no arguments."""
+        assert APIEndpoint.BEATMAPSET_SEARCH.format() == f"{API_BASEURL}/beatmapsets/search"
+
+    def test_enum_members_format_as_their_values(self):
+        """Test that str-valued enum members can be passed without ``.value``."""
+        assert APIEndpoint.SCORES.format(user=1, type=ScoreType.BEST) == f"{API_BASEURL}/users/1/scores/best"
+        assert APIEndpoint.USER.format(user=1, mode=Ruleset.MANIA) == f"{API_BASEURL}/users/1/mania"
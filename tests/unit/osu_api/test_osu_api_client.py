@@ -80,9 +80,12 @@ async def test_get_beatmap_caches_response(api_client):
             mock_beatmap.model_validate.return_value = mock_beatmap_instance
             
             await api_client_obj.get_beatmap(mock_data["id"])
-        
-    assert mock_redis.hset.called
-    assert mock_redis.expire.called
+
+    mock_pipeline = mock_redis.pipeline.return_value
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    assert mock_pipeline.hset.called
+    assert mock_pipeline.expire.called
+    mock_pipeline.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -176,6 +179,28 @@ async def test_get_beatmapset_from_api(api_client):
     assert result["id"] == mock_data["id"]
 
 
+@pytest.mark.asyncio
+async def test_get_beatmapset_caches_response(api_client):
+    api_client_obj, mock_redis = api_client
+    fixture_manager = FixtureReader()
+    mock_data = _get_beatmapset_with_fallback(fixture_manager)
+
+    mock_redis.hgetall.return_value = None
+
+    mock_response = MockResponse(mock_data)
+    api_client_obj._http_client.get = AsyncMock(return_value=mock_response)
+
+    with patch('app.osu_api.client.osu_api_client.Beatmapset') as mock_beatmapset:
+            mock_beatmapset.model_validate.return_value.serialize.return_value = mock_data
+
+            await api_client_obj.get_beatmapset(mock_data["id"])
+
+    mock_pipeline = mock_redis.pipeline.return_value
+    mock_pipeline.hset.assert_called_once_with(f"cached_beatmapset:{mock_data['id']}", mapping=mock_data)
+    assert mock_pipeline.expire.called
+    mock_pipeline.execute.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_user(api_client):
     api_client_obj, mock_redis = api_client
@@ -84,6 +84,6 @@ async def test_get_rankings_includes_limit_and_offset(api_client):
     api_client_obj._http_client.get = AsyncMock(return_value=mock_response)
 
     await api_client_obj.get_rankings(Ruleset.OSU, "performance", limit=100, offset=50)
-    called_url = str(api_client_obj._http_client.get.call_args[0][0])
-    assert "limit=100" in called_url
-    assert "offset=50" in called_url
+    called_params = api_client_obj._http_client.get.call_args.kwargs["params"]
+    assert called_params["limit"] == 100
+    assert called_params["offset"] == 50
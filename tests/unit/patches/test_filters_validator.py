@@ -1,5 +1,6 @@
 import pytest
 
+from app.exceptions import DeepObjectValidationError
 from app.patches.validators.filters import validate_filters
 
 
@@ -229,6 +230,44 @@ class TestFiltersValidator:
         with pytest.raises(Exception):
             validate_filters(filters, schema)
 
+    def test_validate_filters_integer_type_raises_for_bool(self):
+        """Test that a boolean is not accepted as an integer."""
+        schema = {
+            "properties": {
+                "id": {"type": "integer"}
+            }
+        }
+
+        with pytest.raises(DeepObjectValidationError, match="Expected integer, got bool"):
+            validate_filters({"id": True}, schema)
+
+    def test_validate_filters_number_type_raises_for_bool(self):
+        """Test that a boolean is not accepted as a number."""
+        schema = {
+            "properties": {
+                "value": {"type": "number"}
+            }
+        }
+
+        with pytest.raises(DeepObjectValidationError, match="Expected number, got bool"):
+            validate_filters({"value": False}, schema)
+
+    def test_validate_filters_oneof_integer_branch_rejects_bool(self):
+        """Test that a boolean does not match an integer oneOf branch."""
+        schema = {
+            "properties": {
+                "id": {
+                    "oneOf": [
+                        {"type": "object", "properties": {"eq": {"type": "integer"}}},
+                        {"type": "integer"}
+                    ]
+                }
+            }
+        }
+
+        with pytest.raises(DeepObjectValidationError, match="Expected integer, got bool"):
+            validate_filters({"id": True}, schema)
+
     def test_validate_filters_number_type(self):
         """Test validation of number type (int or float)."""
         schema = {
@@ -357,3 +396,92 @@ class TestFiltersValidator:
 
         with pytest.raises(Exception):
             validate_filters(filters, schema)
+
+    def test_validate_filters_error_path_points_at_failing_key(self):
+        """Test that the reported path is the exact location of the failure."""
+        schema = {
+            "properties": {
+                "user": {
+                    "type": "object",
+                    "properties": {"ids": {"type": "array", "items": {"type": "integer"}}}
+                }
+            }
+        }
+
+        with pytest.raises(DeepObjectValidationError) as exc_info:
+            validate_filters({"user": {"ids": [1, "x"]}}, schema)
+
+        assert exc_info.value.path == ("user", "ids", "1")
+
+    def test_validate_filters_path_recovers_after_failed_oneof_branch(self):
+        """Test that keys from a failed oneOf branch don't leak into later error paths."""
+        schema = {
+            "properties": {
+                "user": {
+                    "oneOf": [
+                        {"type": "object", "properties": {"name": {"type": "object", "properties": {"eq": {"type": "string"}}}}},
+                        {"type": "object", "properties": {"name": {"type": "object", "properties": {"eq": {"type": "integer"}}}}}
+                    ]
+                }
+            }
+        }
+
+        validate_filters({"user": {"name": {"eq": 1}}}, schema)
+
+        with pytest.raises(DeepObjectValidationError) as exc_info:
+            validate_filters({"user": {"name": {"eq": 1}}, "unknown": 1}, schema)
+
+        assert exc_info.value.path == ("unknown",)
+
+    def test_validate_filters_oneof_dispatches_on_value_type(self):
+        """Test that a scalar matching a later oneOf branch is accepted."""
+        schema = {
+            "properties": {
+                "id": {
+                    "oneOf": [
+                        {"type": "object", "properties": {"eq": {"type": "integer"}}},
+                        {"type": "string"},
+                        {"type": "integer"}
+                    ]
+                }
+            }
+        }
+
+        assert validate_filters({"id": 5}, schema) is None
+        assert validate_filters({"id": {"eq": 5}}, schema) is None
+
+    def test_validate_filters_oneof_no_match_reports_last_branch_error(self):
+        """Test that an unmatched oneOf reports the error of the last branch tried."""
+        schema = {
+            "properties": {
+                "id": {
+                    "oneOf": [
+                        {"type": "object", "properties": {"eq": {"type": "integer"}}},
+                        {"type": "integer"},
+                        {"type": "string"}
+                    ]
+                }
+            }
+        }
+
+        with pytest.raises(DeepObjectValidationError, match="Expected string, got float"):
+            validate_filters({"id": 1.5}, schema)
+
+    def test_validate_filters_date_time_result_is_stable_across_calls(self):
+        """Test that memoized date-time checks keep accepting and rejecting the same values."""
+        schema = {"properties": {"created_at": {"type": "string", "format": "date-time"}}}
+
+        for _ in range(2):
+            assert validate_filters({"created_at": "2024-01-01T00:00:00Z"}, schema) is None
+
+            with pytest.raises(DeepObjectValidationError):
+                validate_filters({"created_at": "not-a-date"}, schema)
+
+    def test_validate_filters_empty_dict_skips_schema(self):
+        """Test that an empty filter object is accepted without inspecting the schema."""
+        assert validate_filters({}, None) is None
+
+    def test_validate_filters_empty_non_dict_raises(self):
+        """Test that an empty non-dict filter value is still rejected."""
+        with pytest.raises(DeepObjectValidationError, match="Expected a dict for filter object"):
+            validate_filters([], {"properties": {}})
@@ -1,6 +1,9 @@
+import sys
+
 import pytest
 
-from app.patches.validators.include import validate_include
+from app.exceptions import DeepObjectValidationError
+from app.patches.validators.include import validate_include, compile_include_validator, get_include_validator
 
 
 class TestIncludeValidator:
@@ -253,3 +256,74 @@ class TestIncludeValidator:
 
         with pytest.raises(Exception):
             validate_include(include, schema)
+
+    def test_validate_include_handles_nesting_beyond_recursion_limit(self):
+        """Test that deeply nested includes are validated without recursion."""
+        depth = sys.getrecursionlimit() + 100
+        schema = {"properties": {"id": {"type": "boolean"}}}
+        include = {"id": "yes"}
+        for _ in range(depth):
+            schema = {"properties": {"nested": {"type": "object", **schema}}}
+            include = {"nested": include}
+
+        with pytest.raises(DeepObjectValidationError) as exc_info:
+            validate_include(include, schema)
+
+        assert exc_info.value.path == ("nested",) * depth + ("id",)
+
+
+class TestCompiledIncludeValidator:
+    """Test include validators compiled from a schema."""
+
+    SCHEMA = {
+        "properties": {
+            "id": {"type": "boolean"},
+            "user": {
+                "oneOf": [
+                    {"type": "boolean", "enum": [True]},
+                    {"type": "object", "properties": {"profile": {"type": "boolean", "enum": [False]}}}
+                ]
+            }
+        }
+    }
+
+    def test_compiled_validator_accepts_valid_include(self):
+        """Test that a valid nested include passes."""
+        validate = compile_include_validator(self.SCHEMA)
+
+        assert validate({"id": True, "user": {"profile": False}}) is None
+
+    @pytest.mark.parametrize(
+        "include",
+        [
+            {"unknown": True},
+            {"id": "yes"},
+            {"user": False},
+            {"user": 1.5},
+            {"user": {"profile": True}},
+            {"user": {"unknown": True}},
+        ]
+    )
+    def test_compiled_validator_matches_validate_include(self, include):
+        """Test that the compiled validator raises the same error as validate_include."""
+        validate = compile_include_validator(self.SCHEMA)
+
+        with pytest.raises(DeepObjectValidationError) as expected:
+            validate_include(include, self.SCHEMA)
+
+        with pytest.raises(DeepObjectValidationError) as actual:
+            validate(include)
+
+        assert actual.value.path == expected.value.path
+        assert str(actual.value) == str(expected.value)
+
+    def test_get_include_validator_is_cached_per_schema(self):
+        """Test that one schema always yields the same compiled validator."""
+        assert get_include_validator(self.SCHEMA) is get_include_validator(self.SCHEMA)
+
+    def test_validate_include_prefixes_error_path(self):
+        """Test that the path prefix is prepended to compiled error paths."""
+        with pytest.raises(DeepObjectValidationError) as exc_info:
+            validate_include({"user": {"profile": True}}, self.SCHEMA, ["include"])
+
+        assert exc_info.value.path == ("include", "user", "profile")
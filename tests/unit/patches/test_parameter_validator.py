@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from urllib.parse import urlencode
 from connexion.lifecycle import ConnexionRequest
 
@@ -101,17 +102,6 @@ def make_validator(parameters=None, strict_validation=False, security_query_para
     )
 
 
-def setup_request_scope(validator, request, scope_path="/api/v1/test"):
-    """Set up request scope for testing."""
-    scope = {
-        "type": "http",
-        "path": scope_path
-    }
-    connexion_request = ConnexionRequest(scope, uri_parser=validator.uri_parser)
-    validator.request_scopes[connexion_request] = scope
-    return connexion_request
-
-
 def make_request(query_params=None, scope_path="/api/v1/test", validator=None):
     """Create a ConnexionRequest with query parameters.
     
@@ -158,11 +148,6 @@ def make_request(query_params=None, scope_path="/api/v1/test", validator=None):
 class TestParameterValidator:
     """Test parameter validation with Connexion integration."""
 
-    def test_init_sets_request_scopes(self):
-        """Test that init sets request_scopes."""
-        validator = make_validator()
-        assert validator.request_scopes == {}
-
     def test_validate_query_parameter_sorting(self):
         """Test validation of sorting parameter."""
         validator = make_validator()
@@ -300,6 +285,27 @@ class TestParameterValidator:
 
         assert result is None
 
+    def test_validate_query_parameter_include_search_skips_unknown_fields(self):
+        """Test that /search include values are not checked against the route's include schema."""
+        validator = make_validator()
+        param = {"name": "include", "in": "query", "schema": {"title": "BeatmapInclude"}}
+
+        search_request = make_request(
+            query_params={"include[not_a_field]": "true"},
+            scope_path="/api/v1/search",
+            validator=validator
+        )
+        other_request = make_request(
+            query_params={"include[not_a_field]": "true"},
+            scope_path="/api/v1/beatmaps",
+            validator=validator
+        )
+
+        assert validator.validate_query_parameter(param, search_request) is None
+
+        with pytest.raises(Exception):
+            validator.validate_query_parameter(param, other_request)
+
     def test_validate_query_parameter_default_validation(self):
         """Test that parameters with default values are handled correctly."""
         validator = make_validator()
@@ -344,8 +350,8 @@ class TestParameterValidator:
 
         assert result is None
 
-    def test_validate_sets_and_clears_request_scopes(self):
-        """Test that request_scopes is set and cleared during validation."""
+    def test_validate_accepts_scope_without_query_parameters(self):
+        """Test that validating a scope without query parameters succeeds."""
         validator = make_validator()
         
         scope = {
@@ -357,8 +363,6 @@ class TestParameterValidator:
 
         validator.validate(scope)
 
-        assert validator.request_scopes == {}
-
     def test_validate_calls_validate_request(self):
         """Test that validate calls validate_request."""
         validator = make_validator()
@@ -370,14 +374,11 @@ class TestParameterValidator:
             "headers": []
         }
 
-        # validate_request will try to validate query params but there are none
-        # so it should raise an exception (or not, depending on implementation)
-        try:
+        with patch.object(validator, "validate_request") as mock_validate_request:
             validator.validate(scope)
-        except Exception:
-            pass  # Expected to fail since there's no query params to validate
 
-        assert validator.request_scopes == {}
+        request = mock_validate_request.call_args.args[0]
+        assert request.scope is scope
 
     def test_validate_preserves_scope(self):
         """Test that scope is preserved through validation."""
@@ -1,6 +1,7 @@
 import pytest
 
-from app.patches.validators.sorting import validate_sorting
+from app.exceptions import ArrayValidationError
+from app.patches.validators.sorting import validate_sorting, compile_sorting_validator
 
 
 class TestSortingValidator:
@@ -294,3 +295,57 @@ class TestSortingValidator:
         # Should fail because we can't get allowed fields from schema
         with pytest.raises(Exception):
             validate_sorting(sorting, schema)
+
+    def test_validate_sorting_distinguishes_schemas(self):
+        """Test that allowed values cached for one schema don't apply to another."""
+        id_schema = {"items": {"properties": {"field": {"enum": ["id"]}}}}
+        name_schema = {"items": {"properties": {"field": {"enum": ["name"]}}}}
+
+        validate_sorting([{"field": "id"}], id_schema)
+        validate_sorting([{"field": "name"}], name_schema)
+
+        with pytest.raises(ArrayValidationError):
+            validate_sorting([{"field": "name"}], id_schema)
+
+    def test_validate_sorting_extra_keys_error_lists_keys(self):
+        """Test that the unexpected keys are reported in the error."""
+        schema = {"items": {"properties": {"field": {"enum": ["id"]}}}}
+
+        with pytest.raises(ArrayValidationError, match="extra"):
+            validate_sorting([{"field": "id", "extra": 1}], schema)
+
+
+class TestCompiledSortingValidator:
+    """Test sorting validators compiled from a schema."""
+
+    SCHEMA = {
+        "items": {
+            "properties": {
+                "field": {"enum": ["id", "name"]},
+                "order": {"enum": ["asc", "desc"]}
+            }
+        }
+    }
+
+    def test_compiled_validator_accepts_valid_sorting(self):
+        """Test that valid sorting entries pass."""
+        validate = compile_sorting_validator(self.SCHEMA)
+
+        assert validate([{"field": "id", "order": "desc"}, {"field": "name"}]) is None
+
+    @pytest.mark.parametrize(
+        "sorting",
+        [
+            [{"field": "unknown"}],
+            [{"field": "id", "order": "sideways"}],
+            [{"field": "id"}, {"field": "name", "extra": True}],
+        ]
+    )
+    def test_compiled_validator_reports_entry_index(self, sorting):
+        """Test that the failing entry's index is reported."""
+        validate = compile_sorting_validator(self.SCHEMA)
+
+        with pytest.raises(ArrayValidationError) as exc_info:
+            validate(sorting)
+
+        assert exc_info.value.index == len(sorting) - 1
@@ -1,6 +1,11 @@
+import json
+import sys
+from datetime import datetime, timezone
+
 import pytest
 
 from app.patches.uri_parsing import OpenAPIURIParserPatched
+from app.patches.validators.sorting import compile_sorting_validator, _sorting_items
 
 
 pytestmark = pytest.mark.unit
@@ -92,3 +97,152 @@ def test_resolve_query_coerces_include_booleans_and_json_sorting():
     ) == {
         "sorting": [{"field": "beatmapset.title", "order": "desc"}]
     }
+
+
+def test_coerce_include_handles_nesting_beyond_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    value = "no"
+    for _ in range(depth):
+        value = {"nested": value}
+
+    result = OpenAPIURIParserPatched.coerce_include({}, [value], "parameter", "include")
+
+    for _ in range(depth):
+        result = result["nested"]
+    assert result is False
+
+
+def test_coerce_include_preserves_key_order():
+    result = OpenAPIURIParserPatched.coerce_include({}, {"b": "t", "a": ["f", "x"], "c": {"d": "y"}}, "parameter")
+
+    assert list(result) == ["b", "a", "c"]
+    assert result == {"b": True, "a": [False, "x"], "c": {"d": True}}
+
+
+def test_coerce_include_resolves_oneof_branch_by_value_type():
+    param = {
+        "schema": {
+            "properties": {
+                "user": {
+                    "oneOf": [
+                        {"type": "boolean"},
+                        {"type": "object", "properties": {"profile": {"type": "boolean"}}},
+                        {"type": "object", "properties": {"other": {"type": "boolean"}}},
+                    ]
+                }
+            }
+        }
+    }
+
+    assert OpenAPIURIParserPatched.coerce_include(param, {"user": "yes"}, "parameter") == {"user": True}
+    assert OpenAPIURIParserPatched.coerce_include(param, {"user": {"profile": "no"}}, "parameter") == {
+        "user": {"profile": False}
+    }
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("true", True), ("FALSE", False), ("tRuE", True), ("False", False), ("truth", "truth"), ("yes", "yes")],
+)
+def test_coerce_filters_casts_boolean_literals(raw, expected):
+    assert OpenAPIURIParserPatched.coerce_filters({}, {"ranked": {"eq": raw}}, "parameter") == {
+        "ranked": {"eq": expected}
+    }
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("y", True), ("No", False), ("TRUE", True), ("maybe", "maybe")])
+def test_coerce_include_casts_boolean_literals(raw, expected):
+    assert OpenAPIURIParserPatched.coerce_include({}, {"user": raw}, "parameter") == {"user": expected}
+
+
+def test_coerce_sorting_parses_multiple_items():
+    value = ['{"field": "Beatmap.id", "order": "desc"}', None, '{"field": "Beatmap.version"}']
+
+    assert OpenAPIURIParserPatched.coerce_sorting({}, value, "parameter") == [
+        {"field": "Beatmap.id", "order": "desc"},
+        {"field": "Beatmap.version"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ['{"field": "Beatmap.id"}', '{"field": "Beatmap.id"}, {"field": "Beatmap.version"}'],
+        ['{"field": "Beatmap.id"}', ""],
+        ['{"field": "Beatmap.id"}', "{"],
+        ['{"field":"x"', '"order":"asc"}', "1,2"],
+        ['"a', 'b"', "1,2"],
+    ],
+)
+def test_coerce_sorting_rejects_items_that_are_not_one_json_value(value):
+    with pytest.raises(json.JSONDecodeError):
+        OpenAPIURIParserPatched.coerce_sorting({}, value, "parameter")
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2024-01-01T10:00:00Z", datetime(2024, 1, 1, 10, tzinfo=timezone.utc)),
+        ("2024-01-01", datetime(2024, 1, 1)),
+        ("20240101", datetime(2024, 1, 1)),
+        ("1234567", 1234567),
+        ("-3", -3),
+        ("9.5", 9.5),
+        (".5", 0.5),
+        ("1e5", "1e5"),
+        ("Artist Name", "Artist Name"),
+        ("12 apples", "12 apples"),
+        ("", ""),
+    ],
+)
+def test_coerce_filters_casts_primitive_values(raw, expected):
+    assert OpenAPIURIParserPatched.coerce_filters({}, {"value": {"eq": raw}}, "parameter") == {
+        "value": {"eq": expected}
+    }
+
+
+def test_coerce_sorting_reuses_identical_field_order_items():
+    compile_sorting_validator({"items": {"properties": {"field": {"enum": ["Beatmap.id"]}}}})
+    value = ['{"field": "Beatmap.id", "order": "desc"}']
+
+    first = OpenAPIURIParserPatched.coerce_sorting({}, value, "parameter")
+    second = OpenAPIURIParserPatched.coerce_sorting({}, value, "parameter")
+
+    assert first == [{"field": "Beatmap.id", "order": "desc"}]
+    assert second[0] is first[0]
+
+
+def test_coerce_sorting_does_not_share_items_outside_schema_enums():
+    value = ['{"field": "Unknown.field", "order": "desc"}']
+
+    first = OpenAPIURIParserPatched.coerce_sorting({}, value, "parameter")
+    second = OpenAPIURIParserPatched.coerce_sorting({}, value, "parameter")
+
+    assert second == first
+    assert second[0] is not first[0]
+    assert ("Unknown.field", "desc") not in _sorting_items
+
+
+def test_coerce_filters_returns_unchanged_containers_as_is():
+    value = {"artist": {"eq": "Camellia", "in": ["Camellia", "t+pazolite"]}}
+
+    assert OpenAPIURIParserPatched.coerce_filters({}, value, "parameter") is value
+
+
+def test_coerce_filters_copies_containers_with_coerced_values():
+    value = {"artist": {"eq": "Camellia"}, "id": {"in": ["1", "name"]}}
+
+    result = OpenAPIURIParserPatched.coerce_filters({}, value, "parameter")
+
+    assert result == {"artist": {"eq": "Camellia"}, "id": {"in": [1, "name"]}}
+    assert result["artist"] is value["artist"]
+    assert value["id"]["in"] == ["1", "name"]
+
+
+def test_coerce_include_passes_through_non_string_values():
+    value = {"user": True, "beatmaps": {"count": 3, "tags": [False, "yes"]}}
+
+    assert OpenAPIURIParserPatched.coerce_include({}, value, "parameter") == {
+        "user": True,
+        "beatmaps": {"count": 3, "tags": [False, True]},
+    }
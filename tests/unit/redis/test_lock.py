@@ -17,8 +17,20 @@ class TestLockCtx:
         rc = MagicMock(spec=RedisClient)
         rc.set = AsyncMock()
         rc.eval = AsyncMock(return_value=1)
+        rc.pubsub.return_value = self._make_pubsub()
+        rc._wait_for_lock = lambda *args: RedisClient._wait_for_lock(rc, *args)
         return rc
 
+    @staticmethod
+    def _make_pubsub():
+        """Create a mock pub/sub whose waits time out immediately."""
+        pubsub = MagicMock()
+        pubsub.__aenter__ = AsyncMock(return_value=pubsub)
+        pubsub.__aexit__ = AsyncMock(return_value=None)
+        pubsub.subscribe = AsyncMock()
+        pubsub.get_message = AsyncMock(return_value=None)
+        return pubsub
+
     @pytest.mark.asyncio
     async def test_lock_acquired_on_first_set(self, mock_rc):
         """Test lock acquires successfully when SET NX returns True."""
@@ -112,3 +124,50 @@ class TestLockCtx:
             executed.append("inside")
 
         assert executed == ["inside"]
+
+    @pytest.mark.asyncio
+    async def test_lock_waits_on_release_channel(self, mock_rc):
+        """Test a contended lock subscribes to its release channel between retries."""
+        mock_rc.set.side_effect = [None, None, True]
+        pubsub = mock_rc.pubsub.return_value
+
+        async with RedisClient.lock_ctx(mock_rc, key="test_lock", timeout=5.0):
+            pass
+
+        pubsub.subscribe.assert_awaited_once_with("test_lock:released")
+        pubsub.get_message.assert_awaited_once()
+        assert pubsub.get_message.call_args[1]["timeout"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lock_backs_off_between_waits(self, mock_rc):
+        """Test each wait on the release channel is longer than the last, up to the cap."""
+        mock_rc.set.side_effect = [None] * 7 + [True]
+        pubsub = mock_rc.pubsub.return_value
+
+        async with RedisClient.lock_ctx(mock_rc, key="test_lock", timeout=60.0, retry_interval=1):
+            pass
+
+        timeouts = [call[1]["timeout"] for call in pubsub.get_message.call_args_list]
+        assert timeouts == [1, 1.5, 2.25, 3.375, 4, 4]
+
+    @pytest.mark.asyncio
+    async def test_uncontended_lock_skips_pubsub(self, mock_rc):
+        """Test an immediately acquired lock never opens a pub/sub connection."""
+        mock_rc.set.return_value = True
+
+        async with RedisClient.lock_ctx(mock_rc, key="test_lock", timeout=0.1):
+            pass
+
+        mock_rc.pubsub.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lock_release_publishes_on_release_channel(self, mock_rc):
+        """Test the release script is given the channel to notify waiters on."""
+        mock_rc.set.return_value = True
+
+        async with RedisClient.lock_ctx(mock_rc, key="test_lock", timeout=0.1):
+            pass
+
+        call_args = mock_rc.eval.call_args[0]
+        assert 'redis.call("publish", ARGV[2]' in call_args[0]
+        assert call_args[4] == "test_lock:released"
@@ -5,10 +5,14 @@ app.redis.models serialization (Beatmap, Beatmapset, OsuClientOAuthToken,
 QueueRequestHandlerTask).
 """
 
+import json
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 
-from app.redis.models import Beatmap, Beatmapset, OsuClientOAuthToken, QueueRequestHandlerTask
+from app.redis.models import Beatmap, Beatmapset, OsuClientOAuthToken, QueueRequestHandlerTask, QueueRequestValidationTask
+from app.redis.models.utils import parse_datetime
+from app.utils import stable_hash
 
 
 def _full_beatmap_dict():
@@ -102,6 +106,27 @@ class TestBeatmapSerialization:
         d["deleted_at"] = None
         assert Beatmap.model_validate(d).serialize()["deleted_at"] == ""
 
+    def test_serialize_encodes_containers_as_json(self):
+        """Test Beatmap container and bool fields are stored as JSON."""
+        serialized = self._make_beatmap().serialize()
+        assert serialized["failtimes"] == '{"exit": [10, 20], "fail": [30, 40, 50]}'
+        assert serialized["is_scoreable"] == "true"
+        assert serialized["owners"] == "[]"
+
+    def test_deserialize_roundtrip_preserves_containers(self):
+        """Test Beatmap round-trip preserves failtimes and bool fields."""
+        restored = Beatmap.deserialize(self._make_beatmap().serialize())
+        assert restored.failtimes.exit == [10, 20]
+        assert restored.failtimes.fail == [30, 40, 50]
+        assert restored.is_scoreable is True
+
+    def test_deserialize_rejects_non_json_containers(self):
+        """Test non-JSON container payloads raise ValueError for callers to handle."""
+        serialized = self._make_beatmap().serialize()
+        serialized["failtimes"] = "{'exit': [10, 20], 'fail': [30, 40, 50]}"
+        with pytest.raises(ValueError):
+            Beatmap.deserialize(serialized)
+
 
 class TestBeatmapsetSerialization:
     """Test Beatmapset model serialize/deserialize round-trips."""
@@ -123,6 +148,21 @@ class TestBeatmapsetSerialization:
         assert len(restored.beatmaps) == 1
         assert restored.beatmaps[0].id == 12345
 
+    def test_deserialize_roundtrip_preserves_nested_schemas(self):
+        """Test Beatmapset round-trip preserves nested schema and bool fields."""
+        restored = Beatmapset.deserialize(self._make_beatmapset().serialize())
+        assert restored.hype.required == 2
+        assert restored.covers.card_2x == "x200"
+        assert restored.can_be_hyped is True
+        assert restored.discussion_locked is False
+
+    def test_serialize_stores_beatmaps_as_plain_json(self):
+        """Test nested beatmaps are stored as JSON objects with native value types."""
+        beatmaps = json.loads(self._make_beatmapset().serialize()["beatmaps"])
+        assert beatmaps[0]["id"] == 12345
+        assert beatmaps[0]["deleted_at"] is None
+        assert beatmaps[0]["failtimes"] == {"exit": [10, 20], "fail": [30, 40, 50]}
+
 
 class TestOAuthTokenSerialization:
     """Test OsuClientOAuthToken serialize/deserialize round-trips."""
@@ -211,6 +251,14 @@ class TestQueueRequestHandlerTaskSerialization:
         assert isinstance(restored.completed_at, datetime)
         assert restored.mv_checked is True
 
+    def test_deserialize_rejects_invalid_bool(self):
+        """Test a non-boolean mv_checked payload raises ValueError for callers to handle."""
+        with pytest.raises(ValueError):
+            QueueRequestHandlerTask.deserialize({
+                "user_id": "1", "beatmapset_id": "2", "queue_id": "3",
+                "comment": "test", "mv_checked": "maybe", "completed_at": "", "failed_at": "",
+            })
+
     def test_hashed_id_is_deterministic(self):
         """Test hashed_id is deterministic for same inputs."""
         t1 = QueueRequestHandlerTask(user_id=1, beatmapset_id=2, queue_id=3, comment="a", mv_checked=False)
@@ -221,3 +269,34 @@ class TestQueueRequestHandlerTaskSerialization:
         """Test hashed_id is always a positive integer."""
         task = QueueRequestHandlerTask(user_id=1, beatmapset_id=2, queue_id=3, comment="a", mv_checked=False)
         assert task.hashed_id > 0
+
+
+class TestQueueRequestValidationTaskHashedId:
+    """Test QueueRequestValidationTask.hashed_id derivation."""
+
+    def test_hashed_id_uses_stable_hash(self):
+        """Test hashed_id is derived from the request ID through stable_hash."""
+        task = QueueRequestValidationTask(request_id=7, queue_id=1, beatmapset_id=2)
+        assert task.hashed_id == stable_hash("validation", 7)
+
+    def test_stable_hash_does_not_depend_on_hash_seed(self):
+        """Test stable_hash yields a fixed value, so every process derives the same key."""
+        assert stable_hash("validation", 7) == 7719125351047398735
+
+    def test_stable_hash_is_positive_64_bit(self):
+        """Test stable_hash fits in a signed 64-bit integer and is non-negative."""
+        assert 0 <= stable_hash("validation", 123456789) <= 0x7FFFFFFFFFFFFFFF
+
+
+class TestParseDatetime:
+    """Test the datetime parser shared by the Redis models."""
+
+    @pytest.mark.parametrize("value", ["2024-06-15T12:00:00Z", "2024-06-15T12:00:00+00:00"])
+    def test_parses_utc_suffixes(self, value):
+        """Test both UTC spellings produced by isoformat() and pydantic parse to the same instant."""
+        assert parse_datetime(value) == datetime(2024, 6, 15, 12, tzinfo=timezone.utc)
+
+    def test_rejects_invalid_string(self):
+        """Test invalid strings raise ValueError for callers to handle."""
+        with pytest.raises(ValueError):
+            parse_datetime("not-a-date")
@@ -0,0 +1,76 @@
+"""Unit tests for RedisClient.paginate_scan."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.redis.constants import SCAN_MAX_BATCH_COUNT
+from app.redis.rc import RedisClient
+
+
+def _make_rc(batches: list[list[str]]) -> MagicMock:
+    """Create a mock RedisClient whose SCAN walks the given batches then ends the cursor."""
+    responses = [(i + 1 if i + 1 < len(batches) else 0, batch) for i, batch in enumerate(batches)]
+    rc = MagicMock(spec=RedisClient)
+    rc.scan = AsyncMock(side_effect=responses)
+    return rc
+
+
+class TestPaginateScan:
+    """Test cursor-driven key pagination."""
+
+    @pytest.mark.asyncio
+    async def test_returns_all_keys_without_limit(self):
+        """Test every batch is consumed until the cursor returns to 0."""
+        rc = _make_rc([["a", "b"], [], ["c"]])
+
+        keys = await RedisClient.paginate_scan(rc, "task:*")
+
+        assert keys == ["a", "b", "c"]
+        assert rc.scan.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_offset_spans_batches(self):
+        """Test the offset skips keys across batch boundaries."""
+        rc = _make_rc([["a", "b"], ["c", "d"], ["e"]])
+
+        keys = await RedisClient.paginate_scan(rc, "task:*", offset=3)
+
+        assert keys == ["d", "e"]
+
+    @pytest.mark.asyncio
+    async def test_stops_scanning_once_limit_reached(self):
+        """Test no further SCAN calls are made after the limit is filled."""
+        rc = _make_rc([["a", "b", "c"], ["d"]])
+
+        keys = await RedisClient.paginate_scan(rc, "task:*", limit=2, offset=1)
+
+        assert keys == ["b", "c"]
+        rc.scan.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_passes_pattern_type_and_batch_count(self):
+        """Test SCAN receives the pattern, type filter and a large batch count."""
+        rc = _make_rc([["a"]])
+
+        await RedisClient.paginate_scan(rc, "task:*", limit=5, offset=2000, type_="HASH")
+
+        rc.scan.assert_awaited_once_with(0, match="task:*", count=2005, _type="HASH")
+
+    @pytest.mark.asyncio
+    async def test_caps_batch_count_for_deep_offsets(self):
+        """Test the SCAN count hint never exceeds the ceiling, however deep the offset."""
+        rc = _make_rc([["a"]])
+
+        await RedisClient.paginate_scan(rc, "task:*", limit=5, offset=10_000_000)
+
+        rc.scan.assert_awaited_once_with(0, match="task:*", count=SCAN_MAX_BATCH_COUNT, _type=None)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batches, expected", [([[]], []), ([["a", "b"]], ["a", "b"])])
+    async def test_offset_none_is_treated_as_zero(self, batches, expected):
+        """Test an omitted offset (None) skips nothing instead of raising."""
+        rc = _make_rc(batches)
+
+        keys = await RedisClient.paginate_scan(rc, "task:*", offset=None)
+
+        assert keys == expected
@@ -1,8 +1,10 @@
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 from app.redis.decorators import rate_limit
 from app.exceptions import RateLimitExceededError
+from app.redis.enums import Namespace
 
 
 class TestRateLimitDecorator:
@@ -242,3 +244,43 @@ class TestRateLimitDecorator:
 
         with pytest.raises(RateLimitExceededError):
             await func_b(mock_client_b)
+
+    async def test_rate_limit_uses_window_counter_key(self, mock_redis_client):
+        """Test that calls within one window share the window's counter key."""
+
+        @rate_limit(limit_per_window=10, auto_retry=False)
+        async def test_func(self):
+            return "success"
+
+        window_start = datetime(2024, 6, 15, 12, 30, tzinfo=timezone.utc)
+        expected_key = Namespace.RATE_LIMIT_COUNTER.hash_name(int(window_start.timestamp()))
+
+        with patch("app.redis.decorators.time.time", side_effect=[
+            window_start.replace(second=5).timestamp(),
+            window_start.replace(second=50).timestamp(),
+            window_start.replace(minute=31, second=1).timestamp(),
+        ]):
+            for _ in range(3):
+                await test_func(mock_redis_client)
+
+        keys = [call.args[0] for call in mock_redis_client.incr.call_args_list]
+        assert keys[:2] == [expected_key, expected_key]
+        assert keys[2] == Namespace.RATE_LIMIT_COUNTER.hash_name(int(window_start.timestamp()) + 60)
+
+    async def test_rate_limit_exceeded_reports_next_window(self, mock_redis_client):
+        """Test that the raised error points at the start of the next window."""
+
+        @rate_limit(limit_per_window=1, auto_retry=False)
+        async def test_func(self):
+            return "success"
+
+        mock_redis_client.incr = AsyncMock(return_value=2)
+        now = datetime(2024, 6, 15, 12, 30, 20, tzinfo=timezone.utc)
+
+        with patch("app.redis.decorators.time.time", return_value=now.timestamp()):
+            with pytest.raises(RateLimitExceededError) as exc_info:
+                await test_func(mock_redis_client)
+
+        assert exc_info.value.next_window == datetime(2024, 6, 15, 12, 31, tzinfo=timezone.utc)
+        assert exc_info.value.last_call_timestamp == now.timestamp()
+        mock_redis_client.expire.assert_not_called()